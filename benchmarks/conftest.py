@@ -0,0 +1,137 @@
+#
+# Fixtures for the verifier benchmarks.
+#
+# The benchmarks measure the controller side costs of the verifier without
+# creating any instances. The verifier is created with a stand-in molecule
+# configuration, a generated inventory, and generated test data.
+#
+
+import json
+import os
+import sys
+
+import pytest
+
+# The verifier stand-ins are shared with the unit tests.
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+
+from stubs import make_verifier  # noqa: E402
+
+__all__ = ['make_verifier']
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--import-baseline', metavar='REVISION',
+        help='git revision of the plugin to compare the import time with')
+
+
+def make_hosts(count, connection='docker'):
+    hosts = {}
+    for n in range(count):
+        host = {'ansible_connection': connection}
+        if connection == 'ssh':
+            host.update({
+                'ansible_host': f'10.0.{n // 250}.{n % 250 + 1}',
+                'ansible_user': 'vagrant',
+                'ansible_port': 22,
+                'ansible_private_key_file': f'/keys/instance{n:04d}',
+                'ansible_ssh_common_args': '-o StrictHostKeyChecking=no',
+            })
+        hosts[f'instance{n:04d}'] = host
+    return hosts
+
+
+@pytest.fixture
+def hostvars_file(tmp_path):
+    """
+    Write a hostvars.json file for the given number of hosts, with padding to
+    simulate large host variables.
+    """
+    def write(count, padding=0):
+        data = {}
+        for n in range(count):
+            data[f'instance{n:04d}'] = {
+                'home': f'/home/user{n:04d}',
+                'padding': 'x' * padding,
+            }
+        path = tmp_path / 'hostvars.json'
+        path.write_text(json.dumps(data))
+        return path
+    return write
+
+
+def write_output(path, suites, tests, rf7=True):
+    """
+    Write a robot output file with the given number of suites and tests per
+    suite.
+    """
+    if rf7:
+        status = 'start="2024-01-01T00:00:00.000000" elapsed="1.500000"'
+        root = 'generator="Robot 7.0" rpa="false" schemaversion="5"'
+    else:
+        status = ('starttime="20240101 00:00:00.000" '
+                  'endtime="20240101 00:00:01.500"')
+        root = 'generator="Robot 6.1.1" rpa="false" schemaversion="4"'
+    with open(path, 'w') as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<robot {root}>\n')
+        f.write('<suite id="s1" name="Tests">\n')
+        for s in range(1, suites + 1):
+            f.write(f'<suite id="s1-s{s}" name="Suite {s}">\n')
+            for t in range(1, tests + 1):
+                f.write(f'<test id="s1-s{s}-t{t}" name="Test {t}">\n'
+                        f'<kw name="Log" owner="BuiltIn">\n'
+                        f'<msg level="INFO">Message {t}</msg>\n'
+                        f'<arg>Message {t}</arg>\n'
+                        f'<status status="PASS" {status}/>\n</kw>\n'
+                        f'<status status="PASS" {status}/>\n</test>\n')
+            f.write(f'<status status="PASS" {status}/>\n</suite>\n')
+        f.write(f'<status status="PASS" {status}/>\n</suite>\n')
+        f.write('<statistics>\n<total>\n'
+                f'<stat pass="{suites * tests}" fail="0" skip="0">'
+                'All Tests</stat>\n</total>\n<tag/>\n<suite/>\n'
+                '</statistics>\n<errors/>\n</robot>\n')
+    return path
+
+
+@pytest.fixture
+def output_files(tmp_path):
+    """
+    Write robot output files for the given number of hosts.
+    """
+    def write(hosts, suites, tests, rf7=True):
+        outputs = []
+        for n in range(hosts):
+            name = f'instance{n:04d}'
+            path = tmp_path / f'{name}.xml'
+            outputs.append((name, str(write_output(path, suites, tests,
+                                                   rf7))))
+        return outputs
+    return write
+
+
+@pytest.fixture
+def test_tree(tmp_path):
+    """
+    Create a tree of robot test suites which import shared resource files.
+    """
+    def create(suites, resources):
+        top = tmp_path / 'tests'
+        res = tmp_path / 'resources'
+        res.mkdir(exist_ok=True)
+        for r in range(resources):
+            (res / f'common{r}.resource').write_text(
+                '*** Keywords ***\n'
+                f'Keyword {r}\n    Log    {r}\n')
+        for s in range(suites):
+            directory = top / f'group{s % 10}'
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / f'suite{s}.robot').write_text(
+                '*** Settings ***\n'
+                f'Resource    ../../resources/common{s % resources}.resource\n'
+                'Library    OperatingSystem\n'
+                '*** Test Cases ***\n'
+                f'Test {s}\n    Keyword {s % resources}\n')
+        return top, res
+    return create
@@ -0,0 +1,41 @@
+#
+# Benchmark the per host costs of the verifier with large inventories.
+#
+
+import pytest
+from molecule.provisioner import ansible_playbook
+
+from conftest import make_hosts
+from stubs import StubPlaybook
+
+
+@pytest.mark.parametrize('count', [100, 1000])
+def test_load_hostvars(benchmark, make_verifier, hostvars_file, count):
+    hostvars_file(count, padding=1024)
+    verifier = make_verifier({}, make_hosts(count))
+    benchmark(verifier.load_hostvars)
+    assert len(verifier.hostvars) == count
+
+
+@pytest.mark.parametrize('connection', ['docker', 'kubectl', 'local', 'ssh'])
+@pytest.mark.parametrize('count', [100, 1000])
+def test_bake(benchmark, make_verifier, hostvars_file, connection, count):
+    hostvars_file(count)
+    hosts = make_hosts(count, connection)
+    options = {
+        'tests': [{'source': '/src/tests/', 'execute': ['a', 'b', 'c']}],
+        'robot': {'exitonerror': True, 'report': 'index.html'},
+    }
+    verifier = make_verifier(options, hosts)
+    verifier.load_hostvars()
+
+    def bake_all():
+        return [verifier.bake(name, host) for name, host in hosts.items()]
+    commands = benchmark(bake_all)
+    assert len(commands) == count
+
+
+def test_execute_playbook(benchmark, make_verifier, monkeypatch):
+    monkeypatch.setattr(ansible_playbook, 'AnsiblePlaybook', StubPlaybook)
+    verifier = make_verifier({'group': 'testers'}, make_hosts(10))
+    benchmark(verifier.execute_playbook, 'verify')
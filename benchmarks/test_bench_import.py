@@ -0,0 +1,93 @@
+#
+# Benchmark loading the verifier plugin. Molecule loads every verifier plugin
+# for each command, including ``molecule list``, so the plugin import time is
+# added to the startup time of every molecule command.
+#
+# Give a git revision with --import-baseline to benchmark the plugin import of
+# that revision as well, for example:
+#
+#    pytest benchmarks/test_bench_import.py --import-baseline HEAD~1
+#
+
+import compileall
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tarfile
+
+import pytest
+
+PLUGIN = 'molecule_robotframework.robotframework'
+
+# Find the modules loaded by the plugin in a new interpreter, after the
+# modules molecule loads before it loads the verifier plugins.
+PROBE = f'''
+import json
+import sys
+import molecule.config
+before = set(sys.modules)
+import {PLUGIN}
+print(json.dumps(sorted(set(sys.modules) - before)))
+'''
+
+
+def export_revision(revision, directory):
+    """
+    Extract the plugin sources of a git revision, with the bytecode files
+    an installed package has.
+    """
+    topdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    archive = directory / 'src.tar'
+    subprocess.run(['git', 'archive', '--output', str(archive), revision,
+                    'src'], cwd=topdir, check=True)
+    with tarfile.open(archive) as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(directory, filter='data')
+        else:
+            tar.extractall(directory)
+    src = directory / 'src'
+    compileall.compile_dir(str(src), quiet=1)
+    return str(src)
+
+
+@pytest.fixture(params=['head', 'baseline'])
+def plugin_modules(request, tmp_path):
+    """
+    The names of the modules loaded by the plugin. The plugin of the
+    baseline revision is loaded from an extracted copy of its sources. The
+    modules are restored after the benchmark.
+    """
+    env = dict(os.environ)
+    path = list(sys.path)
+    if request.param == 'baseline':
+        revision = request.config.getoption('--import-baseline')
+        if not revision:
+            pytest.skip('No --import-baseline revision given.')
+        src = export_revision(revision, tmp_path)
+        env['PYTHONPATH'] = os.pathsep.join(
+            filter(None, [src, env.get('PYTHONPATH')]))
+        sys.path.insert(0, src)
+    proc = subprocess.run([sys.executable, '-c', PROBE], check=True,
+                          stdout=subprocess.PIPE, text=True, env=env)
+    names = json.loads(proc.stdout)
+    saved = {name: sys.modules[name] for name in names
+             if name in sys.modules}
+    for name in names:
+        sys.modules.pop(name, None)
+    yield names
+    for name in names:
+        sys.modules.pop(name, None)
+    sys.modules.update(saved)
+    sys.path[:] = path
+
+
+def test_import_plugin(benchmark, plugin_modules):
+    def unload():
+        for name in plugin_modules:
+            sys.modules.pop(name, None)
+
+    benchmark.extra_info['modules'] = len(plugin_modules)
+    benchmark.pedantic(importlib.import_module, args=(PLUGIN,),
+                       setup=unload, rounds=50)
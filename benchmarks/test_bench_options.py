@@ -0,0 +1,40 @@
+#
+# Benchmark the conversion of the verifier options to robot arguments.
+#
+
+import pytest
+
+from molecule_robotframework.robotframework import dict2args, dict2lines
+
+ROBOT_OPTIONS = {
+    'exitonerror': True,
+    'dryrun': False,
+    'loglevel': 'DEBUG',
+    'include': [f'tag{n}' for n in range(200)],
+    'exclude': [f'skip{n}' for n in range(200)],
+    'variable': [f'NAME{n}:value{n}' for n in range(500)],
+    'metadata': [f'key{n}:value{n}' for n in range(100)],
+    'report': 'index.html',
+    'debugfile': 'debug.log',
+}
+
+
+def test_dict2args(benchmark):
+    args = benchmark(dict2args, ROBOT_OPTIONS)
+    assert len(args) == 2 * (200 + 200 + 500 + 100 + 3) + 1
+
+
+def test_dict2lines(benchmark):
+    lines = benchmark(dict2lines, ROBOT_OPTIONS)
+    assert lines
+
+
+@pytest.mark.parametrize('count', [10, 100, 1000])
+def test_data_sources(benchmark, make_verifier, count):
+    tests = [{'name': f'tests{n}',
+              'source': f'/src/tests{n}/',
+              'execute': [f'suite{m}.robot' for m in range(10)]}
+             for n in range(count)]
+    verifier = make_verifier({'tests': tests})
+    data_sources = benchmark(lambda: verifier.data_sources)
+    assert len(data_sources) == count * 10
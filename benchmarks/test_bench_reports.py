@@ -0,0 +1,56 @@
+#
+# Benchmark the controller side processing of the test files and the robot
+# output files.
+#
+
+import pytest
+
+from molecule_robotframework import merge, results, selection, sync, timings
+
+
+@pytest.mark.parametrize('hosts', [2, 20])
+def test_merge_outputs(benchmark, output_files, tmp_path, hosts):
+    outputs = output_files(hosts, suites=20, tests=50)
+    merged = str(tmp_path / 'merged.xml')
+    stats = benchmark(merge.merge_outputs, outputs, merged, 'Hosts')
+    assert stats.passed == hosts * 20 * 50
+
+
+@pytest.mark.parametrize('rf7', [True, False], ids=['rf7', 'rf6'])
+def test_read_output(benchmark, output_files, rf7):
+    [(_, output)] = output_files(1, suites=50, tests=100, rf7=rf7)
+    rows = benchmark(lambda: list(timings.read_output(output)))
+    assert len(rows) == 50 * 100 + 50 + 1
+
+
+@pytest.mark.parametrize('rf7', [True, False], ids=['rf7', 'rf6'])
+def test_read_totals(benchmark, output_files, rf7):
+    [(_, output)] = output_files(1, suites=50, tests=100, rf7=rf7)
+    totals = benchmark(results.read_totals, output)
+    assert totals == {'pass': 50 * 100, 'fail': 0, 'skip': 0}
+
+
+def test_record_timings(benchmark, output_files, tmp_path):
+    outputs = output_files(10, suites=10, tests=50)
+    db = timings.Timings(str(tmp_path / 'timings.db'))
+    try:
+        run = benchmark(db.record, outputs)
+        assert db.slowest(run)
+    finally:
+        db.close()
+
+
+def test_sync_manifest(benchmark, test_tree):
+    top, _ = test_tree(suites=1000, resources=50)
+    files = benchmark(sync.manifest, str(top) + '/')
+    assert len(files) == 1000
+
+
+def test_selection_index(benchmark, test_tree):
+    top, res = test_tree(suites=1000, resources=50)
+    suites = selection.test_source_suites('tests', str(top) + '/')
+    resources = sorted(str(p) for p in res.iterdir())
+    index = benchmark(selection.build_index, suites, resources, resources,
+                      'common')
+    assert len(index) == 1000
+    assert all(len(entry['inputs']) == 2 for entry in index.values())
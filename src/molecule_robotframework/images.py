@@ -0,0 +1,88 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Prepared Test Instance Images."""
+
+import json
+import subprocess
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+# The labels of a prepared image.
+LABEL_KEY = 'molecule-robotframework.key'
+LABEL_HOME = 'molecule-robotframework.home'
+
+
+def inspect_labels(client, containers):
+    """
+    Read the labels of the given containers with the container engine
+    ``client`` command.
+
+    Returns a dictionary of the container labels by container name. The
+    containers which could not be inspected are omitted.
+    """
+    if not containers:
+        return {}
+    cmd = [*client, 'inspect', '--format', '{{json .Config.Labels}}',
+           *containers]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, text=True)
+    lines = proc.stdout.splitlines()
+    if proc.returncode != 0 or len(lines) != len(containers):
+        LOG.warning('Unable to inspect the containers %s: %s' % (
+            ', '.join(containers), proc.stderr.strip()))
+        return {}
+    labels = {}
+    for container, line in zip(containers, lines):
+        try:
+            labels[container] = json.loads(line) or {}
+        except ValueError:
+            labels[container] = {}
+    return labels
+
+
+def commit(client, container, images, labels):
+    """
+    Save a container as an image with the given labels, and tag the image
+    with each of the given image names.
+    """
+    changes = []
+    for name, value in labels.items():
+        changes.extend(['--change', f'LABEL {name}={json.dumps(value)}'])
+    image = images[0]
+    LOG.info(f'Saving container {container} as image {image}.')
+    proc = subprocess.run([*client, 'commit', *changes, container, image],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True)
+    if proc.returncode != 0:
+        LOG.warning(f'Unable to save container {container}: '
+                    f'{proc.stderr.strip()}')
+        return False
+    for tag in images[1:]:
+        proc = subprocess.run([*client, 'tag', image, tag],
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=True)
+        if proc.returncode != 0:
+            LOG.warning(f'Unable to tag image {image} as {tag}: '
+                        f'{proc.stderr.strip()}')
+    return True
@@ -0,0 +1,144 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Live Robot Framework Results."""
+
+import json
+import threading
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+# The start of a result record written by the robot_listener.py listener.
+RECORD = '\x1e'
+
+
+class LiveResults:
+    """
+    Count the test results of the robot runs as they are reported by the
+    listener on each test instance.
+
+    With ``fail_fast``, the robot runs on all the test instances are stopped
+    after the first test failure on any instance, and the instances which
+    have not been started are skipped.
+    """
+
+    def __init__(self, fail_fast=False):
+        self.fail_fast = fail_fast
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.procs = {}
+        self.aborted = threading.Event()
+
+    def start(self, name, proc):
+        with self.lock:
+            self.counts[name] = {'total': 0, 'pass': 0, 'fail': 0, 'skip': 0}
+            self.procs[name] = proc
+        if self.aborted.is_set():
+            self.stop(name)
+
+    def finish(self, name):
+        with self.lock:
+            proc = self.procs.pop(name, None)
+        if proc and proc.stdin:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    def stop(self, name):
+        """
+        Ask the listener on a test instance to stop the tests.
+        """
+        with self.lock:
+            proc = self.procs.get(name)
+        if not proc or not proc.stdin:
+            return
+        try:
+            proc.stdin.write('stop\n')
+            proc.stdin.flush()
+        except OSError:
+            pass
+
+    def abort(self, reason):
+        with self.lock:
+            if self.aborted.is_set():
+                return
+            self.aborted.set()
+            names = list(self.procs)
+        LOG.error(f'Fail fast: {reason}; stopping the tests on all instances.')
+        for name in names:
+            self.stop(name)
+
+    def summary(self, name):
+        c = self.counts.get(name, {})
+        done = c.get('pass', 0) + c.get('fail', 0) + c.get('skip', 0)
+        return (f'{done}/{c.get("total", 0)} tests, {c.get("pass", 0)} '
+                f'passed, {c.get("fail", 0)} failed, {c.get("skip", 0)} '
+                'skipped')
+
+    def record(self, name, text):
+        """
+        Handle a result record from a test instance.
+        """
+        try:
+            data = json.loads(text)
+        except ValueError:
+            LOG.debug(f'Invalid result record from {name}: {text}')
+            return
+        event = data.get('event')
+        with self.lock:
+            counts = self.counts.setdefault(
+                name, {'total': 0, 'pass': 0, 'fail': 0, 'skip': 0})
+            if event == 'start':
+                # The shards of an instance each report their tests.
+                counts['total'] += data.get('total', 0)
+            elif event == 'test':
+                status = data.get('status', '').lower()
+                if status in counts:
+                    counts[status] += 1
+        if event == 'test' and data.get('status') == 'FAIL' and \
+                not self.aborted.is_set():
+            LOG.error(f'[{name}] FAIL: {data.get("name")}: '
+                      f'{data.get("message", "")}')
+            if self.fail_fast:
+                self.abort(f'test {data.get("name")} failed on {name}')
+        elif event == 'suite' and data.get('level') == 2:
+            LOG.info(f'[{name}] {self.summary(name)}')
+
+    def relay(self, name, stream, write):
+        """
+        Read the output of a robot run, handle the result records, and write
+        the console output lines with ``write``.
+        """
+        pending = ''
+        for line in stream:
+            if RECORD in line:
+                # A record may be written in the middle of a console line.
+                head, text = line.split(RECORD, 1)
+                pending += head
+                self.record(name, text.strip())
+                continue
+            write(pending + line)
+            pending = ''
+        if pending:
+            write(pending + '\n')
@@ -0,0 +1,246 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Robot Framework Output Merging."""
+
+import datetime
+import shutil
+import tempfile
+import xml.sax
+from xml.sax.handler import ContentHandler
+from xml.sax.saxutils import XMLGenerator
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+
+class Stats:
+    """Test status counts."""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def add(self, status):
+        if status == 'PASS':
+            self.passed += 1
+        elif status == 'FAIL':
+            self.failed += 1
+        else:
+            self.skipped += 1
+
+    def update(self, other):
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+
+    @property
+    def status(self):
+        if self.failed:
+            return 'FAIL'
+        if self.passed:
+            return 'PASS'
+        return 'SKIP'
+
+    def attrs(self):
+        return {'pass': str(self.passed),
+                'fail': str(self.failed),
+                'skip': str(self.skipped)}
+
+
+class OutputHandler(ContentHandler):
+    """
+    Copy the results of one robot output file into the merged output file.
+
+    The top-level suite is renamed after the test instance and becomes a
+    child suite of the merged top-level suite. The statistics are dropped
+    and the errors are written to a separate stream, since both are written
+    once at the end of the merged output file. The root element and the
+    merged top-level suite, named ``top``, are started by the handler of the
+    first output file.
+    """
+
+    def __init__(self, out, errors, name, index, top=None):
+        super().__init__()
+        self.out = out
+        self.errors = errors
+        self.name = name
+        self.top = top
+        self.prefix = f's1-s{index}'
+        self.stack = []
+        self.root = None
+        self.status = None
+        self.stats = Stats()
+        self.test_status = None
+
+    def target(self):
+        if 'errors' in self.stack:
+            return self.errors
+        if 'statistics' in self.stack:
+            return None
+        return self.out
+
+    def startElement(self, tag, attrs):
+        parent = self.stack[-1] if self.stack else None
+        self.stack.append(tag)
+        if len(self.stack) == 1:
+            self.root = dict(attrs)
+            if self.top:
+                self.out.startElement(tag, self.root)
+                self.out.startElement('suite', {'id': 's1', 'name': self.top})
+            return
+        if len(self.stack) == 2 and tag in ('statistics', 'errors'):
+            return
+        attrs = dict(attrs)
+        if tag in ('suite', 'test') and attrs.get('id', '').startswith('s1'):
+            attrs['id'] = self.prefix + attrs['id'][2:]
+        if tag == 'suite' and len(self.stack) == 2:
+            attrs['name'] = self.name
+        if tag == 'status' and parent == 'test':
+            self.test_status = attrs.get('status')
+        if tag == 'status' and parent == 'suite' and len(self.stack) == 3:
+            self.status = attrs
+        out = self.target()
+        if out:
+            out.startElement(tag, attrs)
+
+    def endElement(self, tag):
+        depth = len(self.stack)
+        self.stack.pop()
+        if depth == 1 or (depth == 2 and tag in ('statistics', 'errors')):
+            return
+        if tag == 'test':
+            self.stats.add(self.test_status)
+            self.test_status = None
+        out = self.target()
+        if out:
+            out.endElement(tag)
+
+    def characters(self, content):
+        if len(self.stack) < 2:
+            return
+        out = self.target()
+        if out:
+            out.characters(content)
+
+
+def parse_time(value):
+    return datetime.datetime.fromisoformat(value)
+
+
+def merged_status(statuses, stats):
+    """
+    The status element attributes of the merged top-level suite, covering
+    the start and end times of all the test instances.
+    """
+    attrs = {'status': stats.status}
+    if any('start' in s for s in statuses):
+        # Robot Framework 7 and later.
+        times = []
+        for s in statuses:
+            if s.get('start'):
+                start = parse_time(s['start'])
+                end = start + datetime.timedelta(
+                    seconds=float(s.get('elapsed', 0)))
+                times.append((start, end))
+        if times:
+            start = min(t[0] for t in times)
+            end = max(t[1] for t in times)
+            attrs['start'] = start.isoformat()
+            attrs['elapsed'] = '%.6f' % (end - start).total_seconds()
+    else:
+        starts = [s['starttime'] for s in statuses
+                  if s.get('starttime', 'N/A') != 'N/A']
+        ends = [s['endtime'] for s in statuses
+                if s.get('endtime', 'N/A') != 'N/A']
+        attrs['starttime'] = min(starts) if starts else 'N/A'
+        attrs['endtime'] = max(ends) if ends else 'N/A'
+    return attrs
+
+
+def merge_outputs(outputs, path, name):
+    """
+    Merge the robot output files of the test instances into one output file.
+
+    ``outputs`` is a list of (instance name, output file) tuples. Each
+    instance is a child suite of the merged top-level suite called ``name``.
+    The output files are parsed and written incrementally, so the size of
+    the output files does not matter. Returns the merged test status counts.
+    """
+    total = Stats()
+    hosts = []
+    statuses = []
+    root = None
+    with open(path, 'wb') as f, tempfile.TemporaryFile() as e:
+        out = XMLGenerator(f, encoding='utf-8', short_empty_elements=True)
+        errors = XMLGenerator(e, encoding='utf-8', short_empty_elements=True)
+        out.startDocument()
+        for index, (host, output) in enumerate(outputs, start=1):
+            LOG.info(f'Merging robot output file {output}.')
+            handler = OutputHandler(out, errors, host, index,
+                                    top=name if root is None else None)
+            xml.sax.parse(output, handler)
+            if root is None:
+                root = handler.root
+            elif handler.root.get('schemaversion') != \
+                    root.get('schemaversion'):
+                raise ValueError(
+                    f'Unable to merge {output}; the output file schema '
+                    'version does not match.')
+            total.update(handler.stats)
+            hosts.append((host, handler.stats))
+            if handler.status:
+                statuses.append(handler.status)
+
+        out.startElement('status', merged_status(statuses, total))
+        out.endElement('status')
+        out.endElement('suite')
+
+        out.startElement('statistics', {})
+        out.startElement('total', {})
+        out.startElement('stat', total.attrs())
+        out.characters('All Tests')
+        out.endElement('stat')
+        out.endElement('total')
+        out.startElement('tag', {})
+        out.endElement('tag')
+        out.startElement('suite', {})
+        out.startElement('stat', {**total.attrs(), 'id': 's1', 'name': name})
+        out.characters(name)
+        out.endElement('stat')
+        for index, (host, stats) in enumerate(hosts, start=1):
+            attrs = {**stats.attrs(), 'id': f's1-s{index}', 'name': host}
+            out.startElement('stat', attrs)
+            out.characters(f'{name}.{host}')
+            out.endElement('stat')
+        out.endElement('suite')
+        out.endElement('statistics')
+
+        out.startElement('errors', {})
+        out.characters('\n')  # Close the start tag before copying.
+        e.seek(0)
+        shutil.copyfileobj(e, f)
+        out.endElement('errors')
+        out.endElement('robot')
+        out.endDocument()
+    return total
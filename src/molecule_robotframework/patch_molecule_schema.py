@@ -22,39 +22,19 @@
 #
 # Usage: python patch_molecule_schema.py
 #
-# Add 'robotframework' to the verifier names in the installed molecule schema
-# file.  Unfortunately, the verifier name list was hardcoded in molecule as of
-# version 4.0.2 so a local change is required to be able to load the
-# molecule-robotframe verifier plugin.
+# This command is no longer needed. The verifier name list is hardcoded in
+# the molecule schema file, which this command used to change. The plugin now
+# registers the verifier name at runtime, when molecule loads the verifier
+# plugins, so the installed molecule files are not changed. The command is
+# kept so existing setup scripts continue to work.
 #
 
 """Patch Robot Framework Schema."""
 
-import os
-import sys
-import json
-import molecule.data
-
 
 def main():
-    schema_file = os.path.dirname(molecule.data.__file__) + '/molecule.json'
-    print('Reading file ' + schema_file)
-    with open(schema_file, encoding='utf-8') as f:
-        schema = json.load(f)
-
-    try:
-        names = schema['$defs']['VerifierModel']['properties']['name']['enum']
-    except KeyError:
-        sys.exit('Unexpected schema in file ' + schema_file)
-
-    if 'molecule-robotframework' in names:
-        print('Skipping: Schema already patched.')
-    else:
-        os.rename(schema_file, schema_file + '.orig')
-        names.append('molecule-robotframework')
-        with open(schema_file, 'w', encoding='utf-8') as f:
-            json.dump(schema, f, indent=2)
-        print('Updated file ' + schema_file)
+    print('Skipping: The molecule-robotframework verifier is accepted at '
+          'runtime; the molecule schema file is not changed.')
 
 
 if __name__ == '__main__':
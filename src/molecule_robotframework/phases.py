@@ -0,0 +1,89 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Verifier Phase Timings."""
+
+import contextlib
+import json
+import threading
+import time
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+
+class Phases:
+    """
+    Record the duration of the verifier phases.
+
+    Phases may be recorded from concurrent threads, such as the robot runs
+    and the report file downloads of the test instances.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name, host=None):
+        record = {'phase': name, 'host': host, 'start': time.time()}
+        try:
+            yield record
+        finally:
+            record['elapsed'] = time.time() - record['start']
+            with self.lock:
+                self.records.append(record)
+
+    def add_tasks(self, record, path):
+        """
+        Add the playbook task durations saved by the task timer callback.
+        """
+        try:
+            with open(path) as f:
+                record['tasks'] = json.load(f)
+        except (OSError, ValueError):
+            LOG.debug(f'Playbook task durations {path} not found.')
+
+    def save(self, path):
+        with self.lock:
+            records = sorted(self.records, key=lambda r: r['start'])
+        with open(path, 'w') as f:
+            json.dump(records, f, indent=2)
+
+    def summary(self, tasks=5):
+        """
+        Format the phase durations as a table, including the slowest tasks
+        of each playbook.
+        """
+        with self.lock:
+            records = sorted(self.records,
+                             key=lambda r: (r['phase'] == 'total', r['start']))
+        lines = []
+        for record in records:
+            lines.append('%-28s %-20s %10.2fs' % (
+                record['phase'], record['host'] or '', record['elapsed']))
+            slowest = sorted(record.get('tasks', []),
+                             key=lambda t: t['elapsed'], reverse=True)
+            for task in slowest[:tasks]:
+                lines.append('  %-46s %10.2fs' % (
+                    task['task'][:46], task['elapsed']))
+        return lines
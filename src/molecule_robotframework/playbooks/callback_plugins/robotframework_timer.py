@@ -0,0 +1,122 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+#
+# Record the duration of each task of the verifier playbooks. The task
+# durations are saved to the json file named by the
+# MOLECULE_ROBOTFRAMEWORK_TASK_TIMES environment variable, which is set by the
+# verifier. This callback does nothing when the variable is not set.
+#
+
+"""Verifier Playbook Task Timer."""
+
+import json
+import os
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = '''
+    name: robotframework_timer
+    type: aggregate
+    short_description: Record the durations of the verifier playbook tasks.
+    description:
+      - Save the duration of each task, and of each host in each task, to
+        the json file named by the MOLECULE_ROBOTFRAMEWORK_TASK_TIMES
+        environment variable.
+'''
+
+
+class CallbackModule(CallbackBase):
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'robotframework_timer'
+    CALLBACK_NEEDS_ENABLED = False
+
+    def __init__(self):
+        super(CallbackModule, self).__init__()
+        self.path = os.environ.get('MOLECULE_ROBOTFRAMEWORK_TASK_TIMES')
+        self.tasks = {}   # Task records by task uuid.
+        self.starts = {}  # Host start times by task uuid and host name.
+
+    def _task(self, task, now):
+        # Tasks are started once for each host with the free strategy, so
+        # a task is recorded from the first host start to the last host end.
+        record = self.tasks.get(task._uuid)
+        if record is None:
+            record = self.tasks[task._uuid] = {
+                'task': task.get_name(),
+                'start': now,
+                'end': now,
+                'hosts': {},
+            }
+        return record
+
+    def _start(self, task):
+        self._task(task, time.time())
+
+    def _host_start(self, host, task):
+        now = time.time()
+        self._task(task, now)
+        self.starts[(task._uuid, host.get_name())] = now
+
+    def _host_done(self, result):
+        now = time.time()
+        record = self._task(result._task, now)
+        host = result._host.get_name()
+        start = self.starts.pop((result._task._uuid, host), record['start'])
+        record['hosts'][host] = now - start
+        record['end'] = max(record['end'], now)
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._start(task)
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._start(task)
+
+    def v2_runner_on_start(self, host, task):
+        self._host_start(host, task)
+
+    def v2_runner_on_ok(self, result):
+        self._host_done(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._host_done(result)
+
+    def v2_runner_on_skipped(self, result):
+        self._host_done(result)
+
+    def v2_runner_on_unreachable(self, result):
+        self._host_done(result)
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.path:
+            return
+        tasks = []
+        for record in sorted(self.tasks.values(), key=lambda r: r['start']):
+            tasks.append({
+                'task': record['task'],
+                'start': record['start'],
+                'elapsed': record['end'] - record['start'],
+                'hosts': record['hosts'],
+            })
+        with open(self.path, 'w') as f:
+            json.dump(tasks, f, indent=2)
@@ -0,0 +1,88 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+#
+# Robot Framework listener to report the test results to the verifier as
+# they happen.
+#
+# Usage: robot --listener robot_listener.py ...
+#
+# Each event is written to stdout as a json record, which starts with an
+# ASCII record separator character and ends with a newline. The records are
+# written to the same stream as the console output, so the verifier reads the
+# records over the connection used to run robot. A record may be written in
+# the middle of a console output line.
+#
+# The listener stops the tests gracefully, like robot does on the first
+# interrupt signal, when a 'stop' line is read from stdin.
+#
+
+"""Robot Framework Live Results Listener."""
+
+import json
+import os
+import signal
+import sys
+import threading
+
+ROBOT_LISTENER_API_VERSION = 2
+
+RECORD = '\x1e'
+
+_depth = 0
+_lock = threading.Lock()
+
+
+def _write(event, **data):
+    data['event'] = event
+    record = RECORD + json.dumps(data) + '\n'
+    with _lock:
+        sys.__stdout__.write(record)
+        sys.__stdout__.flush()
+
+
+def _watch_stdin():
+    for line in sys.stdin:
+        if line.strip() == 'stop':
+            os.kill(os.getpid(), signal.SIGINT)
+            return
+
+
+def start_suite(name, attrs):
+    global _depth
+    _depth += 1
+    if _depth == 1:
+        _write('start', name=name, total=attrs.get('totaltests', 0))
+        if sys.stdin and not sys.stdin.isatty():
+            thread = threading.Thread(target=_watch_stdin)
+            thread.daemon = True
+            thread.start()
+
+
+def end_suite(name, attrs):
+    global _depth
+    _depth -= 1
+    _write('suite', name=attrs['longname'], level=_depth + 1,
+           status=attrs['status'], elapsed=attrs['elapsedtime'] / 1000.0)
+
+
+def end_test(name, attrs):
+    _write('test', name=attrs['longname'], status=attrs['status'],
+           message=attrs['message'], elapsed=attrs['elapsedtime'] / 1000.0)
@@ -0,0 +1,434 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+#
+# Usage: robot_runner.py [--shards N] [--shard-by suite|test] [--rerun OUTPUT]
+#                        [--durations FILE] -- <robot args>
+#
+# Run the Robot Framework tests in parallel on a test instance. This helper is
+# uploaded to the test instances by the verify playbook and is run with the
+# python interpreter in the Robot Framework virtualenv.
+#
+# The tests selected by the robot options are split into shards, either by
+# suite or by test, and each shard is run in a separate robot process. The
+# shard output files are merged into a single output file, log, and report
+# once all the shards are done. The shards are balanced by the number of tests,
+# or by the test durations of previous runs when a durations file is given.
+#
+# With --rerun, only the tests which failed in the given output file of a
+# previous run are run, and the results are merged into the previous results.
+#
+# The live result records of the robot_listener.py listener are passed
+# through as they are, and a 'stop' line read from stdin is forwarded to the
+# shards as an interrupt signal to stop the tests gracefully.
+#
+# Note: This script must run on the python versions found on the test
+#       instances, so only the standard library and robot may be imported.
+#
+
+"""Robot Framework Shard Runner."""
+
+import argparse
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+
+from robot.api import ExecutionResult, ResultWriter
+from robot.conf import RobotSettings
+from robot.errors import DataError
+from robot.run import RobotFramework
+from robot.running import TestSuiteBuilder
+
+# Options which are handled by the runner and not passed to the shards.
+RESULT_OPTIONS = ('output', 'log', 'report', 'xunit', 'logtitle',
+                  'reporttitle', 'splitlog', 'outputdir')
+
+# Test selection options which are resolved to test names for the shards.
+SELECT_OPTIONS = ('rerunfailed', 'rerunfailedsuites')
+
+# The start of a live result record written by the listener.
+RECORD = '\x1e'
+
+# The robot return code of invalid data or options, used when a shard did
+# not produce its results.
+DATA_ERROR = 252
+
+
+def longname(item):
+    return getattr(item, 'full_name', None) or item.longname
+
+
+def escape(name):
+    """
+    Escape the glob pattern characters in a robot suite or test name.
+    """
+    return ''.join('[%s]' % c if c in '*?[]' else c for c in name)
+
+
+def parse_robot_args(args):
+    """
+    Split the robot command line arguments into options and data sources.
+
+    Raises DataError when the options are invalid.
+    """
+    options, sources = RobotFramework().parse_arguments(args)
+    return options, sources
+
+
+def find_tests(options, sources):
+    """
+    Build the test suite to find the tests selected by the robot options.
+
+    Returns a list of (suite name, test name) tuples in execution order.
+    """
+    settings = RobotSettings(options)
+    kwargs = {}
+    if getattr(settings, 'parse_include', None):
+        kwargs['included_files'] = settings.parse_include
+    builder = TestSuiteBuilder(included_extensions=settings.extension,
+                               rpa=settings.rpa,
+                               allow_empty_suite=True,
+                               **kwargs)
+    suite = builder.build(*sources)
+    config = settings.suite_config
+    for key in ('randomize_suites', 'randomize_tests', 'randomize_seed'):
+        config.pop(key, None)
+    suite.configure(**config)
+    return [(longname(t.parent), longname(t)) for t in suite.all_tests]
+
+
+def split_tests(tests, shards, shard_by='suite', durations=None):
+    """
+    Split the tests into shards.
+
+    When splitting by suite, all the tests of a suite are kept in the same
+    shard so the suite setup and teardown are run only once. The longest
+    groups are assigned first to the least loaded shard. The length of a group
+    is the sum of the durations of its tests when known, otherwise the number
+    of tests.
+    """
+    durations = durations or {}
+    known = sorted(durations[t] for _, t in tests if t in durations)
+    # Tests without a known duration are assumed to take the median time.
+    default = known[len(known) // 2] if known else 1.0
+    groups = {}
+    for suite, test in tests:
+        key = suite if shard_by == 'suite' else test
+        groups.setdefault(key, []).append(test)
+
+    def weight(key):
+        return sum(durations.get(t, default) for t in groups[key])
+
+    buckets = [[] for _ in range(shards)]
+    loads = [0.0] * shards
+    for key in sorted(groups, key=weight, reverse=True):
+        n = loads.index(min(loads))
+        buckets[n].extend(groups[key])
+        loads[n] += weight(key)
+    return [b for b in buckets if b]
+
+
+def run_shard(config):
+    """
+    Run robot in a shard worker process.
+    """
+    with open(config) as f:
+        shard = json.load(f)
+    import robot
+    rc = robot.run(*shard['sources'], **shard['options'])
+    sys.exit(rc)
+
+
+def run_shards(options, sources, shards, shard_by, durations=None):
+    """
+    Run the tests in parallel robot processes and merge the results.
+    """
+    import robot
+    if shards < 2:
+        return robot.run(*sources, **options)
+    tests = find_tests(options, sources)
+    buckets = split_tests(tests, shards, shard_by, durations)
+    if len(buckets) < 2:
+        return robot.run(*sources, **options)
+
+    outputdir = os.path.abspath(options.get('outputdir') or '.')
+    workdir = os.path.join(outputdir, '.shards')
+    if os.path.exists(workdir):
+        shutil.rmtree(workdir)
+    os.makedirs(workdir)
+    print('Running %d tests in %d shards.' % (len(tests), len(buckets)))
+
+    lock = threading.Lock()
+
+    def relay(n, proc):
+        pending = ''
+        for line in proc.stdout:
+            if RECORD in line:
+                # A record may be written in the middle of a console line.
+                head, record = line.split(RECORD, 1)
+                pending += head
+                line = RECORD + record
+            else:
+                line = '[shard %d] %s%s' % (n, pending, line)
+                pending = ''
+            with lock:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+
+    def watch(procs):
+        for line in sys.stdin:
+            if line.strip() == 'stop':
+                for proc, _, _ in procs:
+                    if proc.poll() is None:
+                        proc.send_signal(signal.SIGINT)
+                return
+
+    procs = []
+    for n, bucket in enumerate(buckets, start=1):
+        shard_dir = os.path.join(workdir, str(n))
+        os.makedirs(shard_dir)
+        shard_options = {k: v for k, v in options.items()
+                         if k not in RESULT_OPTIONS + SELECT_OPTIONS}
+        shard_options.update({
+            'test': [escape(t) for t in bucket],
+            'suite': [],
+            'outputdir': shard_dir,
+            'output': 'output.xml',
+            'log': 'NONE',
+            'report': 'NONE',
+        })
+        if debugfile(options):
+            shard_options['debugfile'] = os.path.join(
+                shard_dir, os.path.basename(options['debugfile']))
+        config = os.path.join(shard_dir, 'shard.json')
+        with open(config, 'w') as f:
+            json.dump({'sources': sources, 'options': shard_options}, f)
+        proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--worker', config],
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, universal_newlines=True)
+        thread = threading.Thread(target=relay, args=(n, proc))
+        thread.start()
+        procs.append((proc, thread, shard_dir))
+    if sys.stdin and not sys.stdin.isatty():
+        watcher = threading.Thread(target=watch, args=(procs,))
+        watcher.daemon = True
+        watcher.start()
+
+    outputs = []
+    error = 0
+    for n, (proc, thread, shard_dir) in enumerate(procs, start=1):
+        returncode = proc.wait()
+        thread.join()
+        output = os.path.join(shard_dir, 'output.xml')
+        if returncode > 250 or returncode < 0:
+            # The shard crashed or was killed, so its output file may be
+            # incomplete.
+            print('Shard %d failed with exit code %d.' % (n, returncode))
+            error = max(error, returncode, DATA_ERROR)
+        elif os.path.exists(output):
+            outputs.append(output)
+        else:
+            print('Shard %d output %s is missing.' % (n, output))
+            error = max(error, DATA_ERROR)
+
+    order = {test: i for i, (_, test) in enumerate(tests)}
+    rc = merge_outputs(outputs, options, order)
+    if debugfile(options):
+        merge_debugfiles(options, [d for _, _, d in procs])
+    shutil.rmtree(workdir, ignore_errors=True)
+    return max(rc, error)
+
+
+def debugfile(options):
+    value = options.get('debugfile')
+    return value if value and str(value).upper() != 'NONE' else None
+
+
+def merge_debugfiles(options, shard_dirs):
+    """
+    Concatenate the shard debug files into the debug file given in the robot
+    options, which is relative to the output directory.
+    """
+    name = os.path.basename(options['debugfile'])
+    path = os.path.join(os.path.abspath(options.get('outputdir') or '.'),
+                        options['debugfile'])
+    with open(path, 'w') as f:
+        for n, shard_dir in enumerate(shard_dirs, start=1):
+            shard_debugfile = os.path.join(shard_dir, name)
+            if not os.path.exists(shard_debugfile):
+                continue
+            f.write('# shard %d\n' % n)
+            with open(shard_debugfile) as shard:
+                shutil.copyfileobj(shard, f)
+
+
+def merge_suite(target, source):
+    """
+    Merge the tests and child suites of a shard result suite.
+    """
+    for test in list(source.tests):
+        target.tests.append(test)
+    for suite in list(source.suites):
+        match = [s for s in target.suites if s.name == suite.name]
+        if match:
+            merge_suite(match[0], suite)
+        else:
+            target.suites.append(suite)
+
+
+def sort_suite(suite, order):
+    """
+    Restore the original execution order of the merged tests.
+    """
+    last = len(order)
+    suite.tests = sorted(suite.tests,
+                         key=lambda t: order.get(longname(t), last))
+    for child in suite.suites:
+        sort_suite(child, order)
+
+    def first(s):
+        return min([order.get(longname(t), last) for t in s.all_tests] or
+                   [last])
+    suite.suites = sorted(suite.suites, key=first)
+
+
+def merge_outputs(outputs, options, order):
+    """
+    Merge the shard output files into a single result and write the output
+    file, log, and report. Returns the robot return code.
+    """
+    if not outputs:
+        print('No shard output files to merge.')
+        return 252
+    result = ExecutionResult(outputs[0])
+    for output in outputs[1:]:
+        shard = ExecutionResult(output)
+        merge_suite(result.suite, shard.suite)
+        for msg in shard.errors.messages:
+            result.errors.messages.append(msg)
+    sort_suite(result.suite, order)
+    return write_results(result, options)
+
+
+def write_results(result, options):
+    """
+    Write the output file, log, and report of a result. Returns the robot
+    return code.
+    """
+    writer_options = {k: v for k, v in options.items()
+                      if k in RESULT_OPTIONS}
+    writer_options.setdefault('output', 'output.xml')
+    writer_options.setdefault('outputdir', '.')
+    ResultWriter(result).write_results(**writer_options)
+    return min(result.return_code, 250)
+
+
+def run_rerun(options, sources, shards, shard_by, previous, durations=None):
+    """
+    Rerun the failed tests of a previous run and merge the results into the
+    results of the previous run.
+    """
+    from robot.conf.gatherfailed import gather_failed_tests
+    failed = gather_failed_tests(previous, empty_suite_ok=True)
+    if not failed:
+        print('No failed tests to rerun.')
+        return write_results(ExecutionResult(previous), options)
+
+    outputdir = os.path.abspath(options.get('outputdir') or '.')
+    workdir = os.path.join(outputdir, '.rerun')
+    if os.path.exists(workdir):
+        shutil.rmtree(workdir)
+    os.makedirs(workdir)
+    print('Rerunning %d failed tests.' % len(failed))
+    rerun_options = {k: v for k, v in options.items()
+                     if k not in RESULT_OPTIONS}
+    rerun_options.update({
+        'rerunfailed': previous,
+        'outputdir': workdir,
+        'output': 'output.xml',
+        'log': 'NONE',
+        'report': 'NONE',
+    })
+    if debugfile(options):
+        rerun_options['debugfile'] = os.path.join(outputdir,
+                                                  options['debugfile'])
+    rc = run_shards(rerun_options, sources, shards, shard_by, durations)
+
+    outputs = [previous]
+    output = os.path.join(workdir, 'output.xml')
+    if os.path.exists(output):
+        outputs.append(output)
+    else:
+        print('Rerun output %s is missing.' % output)
+        rc = max(rc, DATA_ERROR)
+    result = ExecutionResult(*outputs, merge=True)
+    merged_rc = write_results(result, options)
+    shutil.rmtree(workdir, ignore_errors=True)
+    return rc if rc > 250 else merged_rc
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run Robot Framework tests in parallel shards.')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--shards', type=int, default=1,
+                        help='number of parallel robot processes')
+    parser.add_argument('--shard-by', choices=('suite', 'test'),
+                        default='suite', help='split tests by suite or test')
+    parser.add_argument('--rerun', metavar='OUTPUT',
+                        help='rerun the failed tests of a previous run')
+    parser.add_argument('--durations', metavar='FILE',
+                        help='json file of the test durations of past runs')
+    parser.add_argument('robot_args', nargs=argparse.REMAINDER,
+                        help='robot options and data sources')
+    args = parser.parse_args()
+    if args.worker:
+        run_shard(args.worker)
+
+    robot_args = args.robot_args
+    if robot_args and robot_args[0] == '--':
+        robot_args = robot_args[1:]
+    durations = None
+    if args.durations and os.path.exists(args.durations):
+        with open(args.durations) as f:
+            durations = json.load(f)
+    shards = max(args.shards, 1)
+    try:
+        options, sources = parse_robot_args(robot_args)
+        if args.rerun:
+            rc = run_rerun(options, sources, shards, args.shard_by,
+                           args.rerun, durations)
+        else:
+            rc = run_shards(options, sources, shards, args.shard_by,
+                            durations)
+    except DataError as e:
+        # Invalid options or data, like robot reports them.
+        print('[ ERROR ] %s' % e)
+        rc = DATA_ERROR
+    sys.exit(rc)
+
+
+if __name__ == '__main__':
+    main()
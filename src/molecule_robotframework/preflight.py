@@ -0,0 +1,189 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Controller Preflight Checks."""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+from molecule import logger
+
+from molecule_robotframework import sync
+
+
+LOG = logger.get_logger(__name__)
+
+# The robot options which change the suites and tests checked by the dryrun.
+DRYRUN_OPTIONS = (
+    'exclude',
+    'extension',
+    'include',
+    'parseinclude',
+    'pythonpath',
+    'suite',
+    'task',
+    'test',
+    'variable',
+)
+
+# Check the syntax of the robot files given as arguments, and of the robot
+# files in the given directories, without running robot.
+PARSE_CHECK = '''
+import os
+import sys
+
+import robot.api
+from robot.api.parsing import ModelVisitor
+
+
+class Errors(ModelVisitor):
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+
+    def generic_visit(self, node):
+        errors = list(getattr(node, 'errors', ()) or ())
+        if getattr(node, 'error', None):
+            errors.append(node.error)
+        for error in errors:
+            print('%s:%s: %s' % (self.path, getattr(node, 'lineno', 0), error))
+            self.count += 1
+        super().generic_visit(node)
+
+
+def parse(path):
+    name = os.path.basename(path)
+    if name.startswith('__init__.'):
+        model = robot.api.get_init_model(path)
+    elif name.endswith('.resource'):
+        model = robot.api.get_resource_model(path)
+    else:
+        model = robot.api.get_model(path)
+    errors = Errors(path)
+    errors.visit(model)
+    return errors.count
+
+
+count = 0
+for source in sys.argv[1:]:
+    if os.path.isfile(source):
+        count += parse(source)
+        continue
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.endswith(('.robot', '.resource')):
+                count += parse(os.path.join(root, filename))
+print('%d syntax errors found.' % count)
+sys.exit(1 if count else 0)
+'''
+
+
+def prepare_venv(directory, packages):
+    """
+    Create a virtualenv on the controller with the given packages installed.
+
+    The virtualenv is reused while the packages, and the contents of the
+    local package files, are unchanged. Returns the virtualenv path.
+    """
+    venv = os.path.join(directory, 'venv')
+    key_file = os.path.join(venv, 'preflight.key')
+    digests = [sync.file_digest(p) for p in packages if os.path.isfile(p)]
+    text = json.dumps([sys.version, packages, digests])
+    key = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    if os.path.exists(key_file):
+        with open(key_file) as f:
+            if f.read().strip() == key:
+                return venv
+    LOG.info(f'Creating the preflight virtualenv {venv}.')
+    subprocess.run([sys.executable, '-m', 'venv', '--clear', venv],
+                   check=True)
+    subprocess.run([os.path.join(venv, 'bin', 'python'), '-m', 'pip',
+                    'install', '--quiet', *packages], check=True)
+    with open(key_file, 'w') as f:
+        f.write(key)
+    return venv
+
+
+def stage(directory, tests, resources):
+    """
+    Copy the test sources and resource files to a directory on the
+    controller, in the same layout as the home directory of the test
+    instances.
+
+    Only ``dir`` test sources and ``file`` resources are staged; the
+    resource templates are rendered for each test instance by the verify
+    playbook. Absolute destination paths are staged relative to the staging
+    directory. Returns the staging directory path.
+    """
+    staging = os.path.join(directory, 'home')
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    for test in tests:
+        if test.get('type', 'dir') != 'dir':
+            continue
+        if not os.path.exists(test['source']):
+            raise FileNotFoundError(f'Test source {test["source"]} not found.')
+        dest = os.path.join(staging, test.get('name', 'tests').lstrip('/'))
+        for path, arcname in sync.walk_source(test['source']):
+            target = os.path.join(dest, arcname)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(path, target)
+    for resource in resources:
+        if resource.get('type', 'file') != 'file':
+            continue
+        dest = os.path.join(staging,
+                            resource.get('directory', '.').lstrip('/'))
+        for path, arcname in sync.walk_source(resource['source']):
+            target = os.path.join(dest, arcname)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(path, target)
+    return staging
+
+
+def dryrun_command(venv, options, data_sources):
+    """
+    The ``robot --dryrun`` command to check the staged data sources.
+    """
+    cmd = [os.path.join(venv, 'bin', 'robot'), '--dryrun',
+           '--output', 'NONE', '--log', 'NONE', '--report', 'NONE',
+           '--console', 'dotted']
+    for option in DRYRUN_OPTIONS:
+        values = options.get(option)
+        if values is None:
+            continue
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        for value in values:
+            cmd.extend([f'--{option}', str(value)])
+    cmd.extend(data_sources)
+    return cmd
+
+
+def parse_command(venv, paths):
+    """
+    The command to check the syntax of the staged robot files.
+    """
+    return [os.path.join(venv, 'bin', 'python'), '-c', PARSE_CHECK, *paths]
@@ -0,0 +1,164 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Robot Framework Verifier Results."""
+
+import json
+import threading
+import xml.etree.ElementTree as ET
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+
+def read_totals(path):
+    """
+    Read the total number of passed, failed, and skipped tests from the
+    statistics of a robot output file.
+
+    The output file is parsed incrementally and the test results are
+    discarded as they are parsed.
+    """
+    stack = []
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem.tag)
+            continue
+        stack.pop()
+        if elem.tag == 'stat' and stack[-2:] == ['statistics', 'total']:
+            return {
+                'pass': int(elem.get('pass', 0)),
+                'fail': int(elem.get('fail', 0)),
+                'skip': int(elem.get('skip', 0)),
+            }
+        if 'statistics' not in stack:
+            elem.clear()
+    return None
+
+
+class Results:
+    """
+    The robot results of the test instances.
+
+    The results are added by the concurrent robot runs. Each instance has
+    the robot return code, which is None when the instance was skipped, the
+    duration of the robot run, and the number of passed, failed, and skipped
+    tests when known.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hosts = {}
+
+    def add(self, name, returncode, elapsed=0.0):
+        with self.lock:
+            self.hosts[name] = {
+                'returncode': returncode,
+                'elapsed': elapsed,
+                'pass': None,
+                'fail': None,
+                'skip': None,
+            }
+
+    def skip(self, name):
+        self.add(name, None)
+
+    def fetch_failed(self, name, returncode):
+        """
+        Fail an instance when its report files could not be retrieved. The
+        robot return code is kept when robot failed.
+        """
+        with self.lock:
+            result = self.hosts.get(name)
+            if result is not None and result['returncode'] == 0:
+                result['returncode'] = returncode or 1
+
+    def set_counts(self, name, counts):
+        with self.lock:
+            result = self.hosts.get(name)
+            if result is not None and counts:
+                for key in ('pass', 'fail', 'skip'):
+                    result[key] = counts.get(key)
+
+    def _names(self, check):
+        with self.lock:
+            return [n for n, r in self.hosts.items() if check(r)]
+
+    def ran(self):
+        return self._names(lambda r: r['returncode'] is not None)
+
+    def failed(self):
+        return self._names(lambda r: r['returncode'] not in (0, None))
+
+    def skipped(self):
+        return self._names(lambda r: r['returncode'] is None)
+
+    @property
+    def passed(self):
+        with self.lock:
+            return bool(self.hosts) and \
+                all(r['returncode'] == 0 for r in self.hosts.values())
+
+    @property
+    def exit_code(self):
+        """
+        The exit code of the verifier; the highest robot return code of the
+        instances, or 1 when no instances were verified.
+        """
+        if self.passed:
+            return 0
+        with self.lock:
+            codes = [r['returncode'] for r in self.hosts.values()
+                     if r['returncode']]
+        return max(codes) if codes else 1
+
+    def save(self, path):
+        with self.lock:
+            data = {
+                'passed': bool(self.hosts) and all(
+                    r['returncode'] == 0 for r in self.hosts.values()),
+                'hosts': self.hosts,
+            }
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+
+    def summary(self):
+        """
+        Format the results of each instance as a table.
+        """
+        def count(value):
+            return '-' if value is None else str(value)
+
+        lines = ['%-20s %-8s %4s %6s %6s %6s %10s' % (
+            'instance', 'status', 'rc', 'pass', 'fail', 'skip', 'elapsed')]
+        with self.lock:
+            for name, r in self.hosts.items():
+                if r['returncode'] is None:
+                    status = 'SKIPPED'
+                elif r['returncode'] == 0:
+                    status = 'PASS'
+                else:
+                    status = 'FAIL'
+                lines.append('%-20s %-8s %4s %6s %6s %6s %9.2fs' % (
+                    name, status, count(r['returncode']), count(r['pass']),
+                    count(r['fail']), count(r['skip']), r['elapsed']))
+        return lines
@@ -31,12 +31,14 @@ except ImportError:
 
 from molecule import logger
 from molecule import util
-from molecule.provisioner import ansible_playbook, ansible_playbooks
 from molecule.api import Verifier
 
 
 LOG = logger.get_logger(__name__)
 
+# The facts needed to install Robot Framework and run robot.
+GATHER_SUBSET = ['!all', '!min', 'distribution', 'env', 'pkg_mgr', 'platform']
+
 
 def as_boolean(data):
     if isinstance(data, bool):
@@ -149,6 +151,40 @@ class Robotframework(Verifier):
                 source: "https://gitrepo-url"
                 version: branch-name
 
+    The test files of a ``dir`` test source are copied with the ``copy``
+    module by default. Set ``sync`` to ``archive`` to upload a single archive
+    of the test files, which is only uploaded when the test files have
+    changed, or to ``rsync`` to synchronize the changed files with the
+    ``ansible.posix.synchronize`` module.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            tests:
+              - name: mytests
+                type: dir
+                sync: archive
+                source: /path/to/my/tests/on/the/controller
+
+    A ``git`` test source with ``sync`` set to ``archive`` is checked out on
+    the controller, with a shallow clone kept in the ephemeral directory, and
+    uploaded like a ``dir`` test source, so git is not installed on the test
+    instances.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            tests:
+              - name: mytests
+                type: git
+                sync: archive
+                source: "https://gitrepo-url"
+                version: branch-name
+
     The test source 'name' specifies the destination path to install files on
     the test instance(s). The directory will be created on the instance if it
     does not already exist.
@@ -193,6 +229,67 @@ class Robotframework(Verifier):
               - robotframework-sshlibrary
               - robotframework-openafslibrary
 
+    The Robot Framework virtualenv may be archived on the controller after it
+    is installed, so new instances with the same requirements, libraries,
+    distribution, and architecture unpack the archive instead of installing
+    the packages with pip.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            venv_cache: yes
+            venv_cache_dir: /var/cache/molecule-robotframework
+
+    Docker and podman test instances which are identical testers can be
+    prepared once. Set ``image_cache`` to save the first instance prepared by
+    the verify playbook as an image, then create the test instances from the
+    saved image to skip the verify playbook in later runs. The image is
+    labeled with a key of the verifier options and the installed files, so
+    the verify playbook is run again when these change.
+
+    .. code-block:: yaml
+
+        platforms:
+          - name: tester01
+            image: ${TESTER_IMAGE:-python:3.11}
+        verifier:
+          name: molecule-robotframework
+          options:
+            image_cache: yes
+            image_cache_name: mytesters
+
+    Then run with ``TESTER_IMAGE=mytesters:latest``.
+
+    The verify playbook gathers only the facts needed to install Robot
+    Framework and run ``robot``, and caches the facts in the scenario
+    ephemeral directory. Set ``gather_subset`` to gather more facts for the
+    resource and variable file templates.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            gather_subset:
+              - '!all'
+              - network
+
+    The verifier playbooks are run with the ``free`` strategy, so each test
+    instance is prepared at its own pace, and with Ansible pipelining. The
+    number of forks, the strategy, and pipelining can be changed for large
+    groups of test instances.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            forks: 100
+            strategy: linear
+            pipelining: no
+
     The inventory group name of the test instances. Defaults to 'all'.
 
     .. code-block:: yaml
@@ -202,13 +299,174 @@ class Robotframework(Verifier):
           options:
             group: testers
 
+    The maximum number of test instances to run ``robot`` on concurrently.
+    Defaults to 1, which runs the tests on one instance at a time. The live
+    output of each instance is prefixed with the instance name when more
+    than one instance is run at a time.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            parallel: 4
+
+    The ``robot`` command is run over the ssh master connection created by
+    the verify playbook for instances with ssh connections. The master
+    connection is kept open for ``ssh_control_persist`` after the last use so
+    the report files are retrieved over the same connection. Set
+    ``ssh_multiplex`` to False to open a new connection to run ``robot``.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            ssh_multiplex: yes
+            ssh_control_persist: 120s
+
+    The test results of each instance can be reported as they happen with
+    ``live_results``. Set ``fail_fast`` to stop the tests on all the instances
+    after the first test failure on any instance.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            parallel: 4
+            fail_fast: yes
+
+    The report files are retrieved with the ``fetch`` module by default. Set
+    ``fetch_method`` to ``archive`` to retrieve a single compressed archive of
+    the report files from each instance, or to ``stream`` to stream the
+    compressed report files over the connection used to run ``robot``,
+    without running the ``verify_fetch_report`` playbook.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            fetch_method: archive
+
+    The report files of each instance can be downloaded as soon as ``robot``
+    is done on the instance, while the tests are still running on the other
+    instances, by setting ``fetch_parallel`` to the maximum number of
+    concurrent downloads.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            parallel: 8
+            fetch_parallel: 2
+
+    The ``robot`` output files retrieved from several test instances can be
+    merged into a single output file, log, and report in ``dest_dir`` by
+    setting ``merge_reports``. Each instance is a top-level suite of the
+    merged results. The output files are merged incrementally, and the log
+    and report are written with ``rebot`` when Robot Framework is installed
+    on the controller. Options for ``rebot`` can be given in ``rebot``.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            merge_reports: yes
+            rebot:
+              name: Testers
+              removekeywords: passed
+
+    Set ``preflight`` to check the tests on the controller before the test
+    instances are prepared. The ``dryrun`` check runs ``robot --dryrun`` and
+    the ``parse`` check only checks the syntax of the robot files. The check
+    is run in a virtualenv cached in the ephemeral directory.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            preflight: dryrun
+
+    Set ``rerunfailed`` to run only the tests which failed in the previous
+    verify, then merge the new results into the previous results. The
+    previous ``robot`` output files are the ones retrieved to ``dest_dir``.
+    All the tests are run on instances without a previous output file.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            rerunfailed: ${ROBOT_RERUNFAILED:-no}
+
+    Set ``changed_only`` to run only the test suites which have changed since
+    the last passing verify. The inputs of each suite, which are the suite
+    file, the parent suite initialization files, and the resource files,
+    variable files, and library files it imports, are recorded in an index
+    in the ephemeral directory with their checksums. Only ``dir`` test
+    sources are supported, and Robot Framework 6.1 or later is required on
+    the test instances.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            changed_only: yes
+
+    Set ``timings`` to record the duration of each suite and test of each
+    instance in a SQLite database in the scenario directory. The slowest
+    tests, and the tests which are slower than their average in the last
+    ``timings_history`` runs, are shown after each verify. The average
+    durations are used to balance the ``shards`` and to start ``robot`` on
+    the longest running instances first.
+
+    .. code-block:: yaml
+
+        verifier:
+          name: molecule-robotframework
+          options:
+            timings: yes
+            timings_history: 10
+            shards: 4
+
+    The duration of each verifier phase, including each task of the
+    verifier playbooks, each ``robot`` run, and each report file download, is
+    saved to ``phases.json`` in the scenario ephemeral directory and shown
+    in a summary at the end of the verify.
+
+    The ``robot`` return code, the number of passed, failed, and skipped
+    tests, and the duration of each instance are saved to ``results.json`` in
+    the scenario ephemeral directory and shown in a summary. The verify fails
+    with the highest ``robot`` return code of the instances unless the tests
+    pass on every instance.
+
     .. _`Robotframework`: https://robotframework.org
     """
 
     def __init__(self, config=None):
+        import threading
+        from molecule_robotframework import phases
+        from molecule_robotframework import schema
+
+        # Molecule creates the verifiers before the scenario is validated,
+        # so our verifier name is accepted by the schema validation.
+        schema.register()
         super(Robotframework, self).__init__(config)
         self._robot_command = None
         self._playbooks = None
+        self._hostvars = None
+        self._fetches = []
+        self._selection = None
+        self._phases = phases.Phases()
+        self._output_lock = threading.Lock()
+        self._live = None
+        self._results = None
 
     @property
     def name(self):
@@ -225,14 +483,19 @@ class Robotframework(Verifier):
     @property
     def playbooks(self):
         if not self._playbooks:
+            from molecule.provisioner import ansible_playbooks
             # Inject a default verify_fetch_report playbook filename.
             if 'verify_fetch_report' not in self._config.config['provisioner']['playbooks']:   # noqa: E501
                 self._config.config['provisioner']['playbooks']['verify_fetch_report'] = 'verify_fetch_report.yml'  # noqa: E501
             self._playbooks = ansible_playbooks.AnsiblePlaybooks(self._config)
         return self._playbooks
 
-    def execute_playbook(self, name):
+    def execute_playbook(self, name, limit=None, extra_vars=None):
         """Excute the named playbook."""
+        import hashlib
+        from molecule.provisioner import ansible_playbook
+        from molecule_robotframework import transport
+
         # First look for the user provided playbook in the scenario directory.
         # If not found, use the playbook bundled with the plugin.
         playbook = self.playbooks._get_playbook(name)
@@ -240,8 +503,76 @@ class Robotframework(Verifier):
             playbook = self._get_bundled_playbook(name)
         pb = ansible_playbook.AnsiblePlaybook(playbook, self._config)
         # Target just the testers (all by default.)
-        pb.add_cli_arg('extra_vars', f'molecule_robotframework_hosts={self.group}')  # noqa: E501
-        pb.execute()
+        variables = {
+            'molecule_robotframework_hosts': self.group,
+            'molecule_robotframework_gather_subset': self.gather_subset,
+            'molecule_robotframework_strategy': self.strategy,
+        }
+        variables.update(extra_vars or {})
+        pb.add_cli_arg('extra_vars', ' '.join(
+            f'{k}={v}' for k, v in variables.items()))
+        if limit:
+            pb.add_cli_arg('limit', limit)
+        if self.ssh_multiplex:
+            pb.add_env_arg('ANSIBLE_SSH_CONTROL_PATH_DIR',
+                           self.ssh_control_path_dir)
+            pb.add_env_arg('ANSIBLE_SSH_CONTROL_PATH',
+                           transport.ANSIBLE_SSH_CONTROL_PATH)
+        if self.forks:
+            pb.add_env_arg('ANSIBLE_FORKS', str(self.forks))
+        if not self.ansible_configured('ANSIBLE_PIPELINING', 'pipelining',
+                                       'defaults', 'connection',
+                                       'ssh_connection'):
+            pb.add_env_arg('ANSIBLE_PIPELINING', str(self.pipelining))
+        # Reuse the facts gathered by the previous verify playbooks, unless
+        # fact caching is configured by the user. The cache is keyed by the
+        # fact subsets, since cached facts are not gathered again.
+        if self.fact_cache and not self.fact_caching_configured():
+            digest = hashlib.sha1(self.gather_subset.encode('utf-8'))
+            pb.add_env_arg('ANSIBLE_GATHERING', 'smart')
+            pb.add_env_arg('ANSIBLE_CACHE_PLUGIN', 'jsonfile')
+            pb.add_env_arg('ANSIBLE_CACHE_PLUGIN_CONNECTION', os.path.join(
+                self._config.scenario.ephemeral_directory,
+                'facts', digest.hexdigest()[:10]))
+        # Record the task durations with our callback plugin.
+        callback_plugins = [os.path.join(os.path.dirname(__file__),
+                                         'playbooks', 'callback_plugins')]
+        existing = self.ansible_env('ANSIBLE_CALLBACK_PLUGINS')
+        if existing:
+            callback_plugins.append(existing)
+        pb.add_env_arg('ANSIBLE_CALLBACK_PLUGINS', ':'.join(callback_plugins))
+        task_times = os.path.join(
+            self._config.scenario.ephemeral_directory,
+            f'tasks-{name}-{limit}.json' if limit else f'tasks-{name}.json')
+        pb.add_env_arg('MOLECULE_ROBOTFRAMEWORK_TASK_TIMES', task_times)
+        with self._phases.phase(f'playbook {name}', limit) as record:
+            try:
+                pb.execute()
+            finally:
+                self._phases.add_tasks(record, task_times)
+
+    def ansible_env(self, name):
+        """
+        The value of an Ansible environment variable of the provisioner.
+        """
+        return self._config.provisioner.env.get(name, os.environ.get(name))
+
+    def ansible_configured(self, env, key, *sections):
+        """
+        Whether an Ansible setting is configured by the user, with an
+        environment variable or the provisioner config options. The
+        config option is looked up in the ``defaults`` section unless other
+        sections are given.
+        """
+        if self.ansible_env(env):
+            return True
+        options = self._config.config['provisioner'] \
+            .get('config_options', {})
+        return any(key in (options.get(section) or {})
+                   for section in sections or ('defaults',))
+
+    def fact_caching_configured(self):
+        return self.ansible_configured('ANSIBLE_CACHE_PLUGIN', 'fact_caching')
 
     @property
     def ansible_args(self):
@@ -255,6 +586,167 @@ class Robotframework(Verifier):
     def group(self):
         return self.options.get('group', 'all')
 
+    @property
+    def parallel(self):
+        """
+        The maximum number of instances to run robot on concurrently.
+        """
+        try:
+            parallel = int(self.options.get('parallel', 1))
+        except (TypeError, ValueError):
+            util.sysexit_with_message(
+                'Invalid parallel option %s' % self.options['parallel'], 1)
+        return max(parallel, 1)
+
+    @property
+    def shards(self):
+        """
+        The number of robot processes to run on each instance.
+        """
+        try:
+            shards = int(self.options.get('shards', 1))
+        except (TypeError, ValueError):
+            util.sysexit_with_message(
+                'Invalid shards option %s' % self.options['shards'], 1)
+        return max(shards, 1)
+
+    @property
+    def shard_by(self):
+        shard_by = self.options.get('shard_by', 'suite')
+        if shard_by not in ('suite', 'test'):
+            util.sysexit_with_message(
+                'Invalid shard_by option %s' % shard_by, 1)
+        return shard_by
+
+    @property
+    def dest_dir(self):
+        """
+        The controller directory to save the report files.
+        """
+        return self.options.get(
+            'dest_dir',
+            os.path.join(self._config.scenario.directory, 'output'))
+
+    @property
+    def fetch_method(self):
+        method = self.options.get('fetch_method', 'fetch')
+        if method not in ('fetch', 'archive', 'stream'):
+            util.sysexit_with_message(
+                'Invalid fetch_method option %s' % method, 1)
+        return method
+
+    @property
+    def fetch_parallel(self):
+        """
+        The maximum number of concurrent report file downloads. The reports
+        are downloaded after all the tests are done when zero.
+        """
+        try:
+            fetch_parallel = int(self.options.get('fetch_parallel', 0))
+        except (TypeError, ValueError):
+            util.sysexit_with_message(
+                'Invalid fetch_parallel option %s' %
+                self.options['fetch_parallel'], 1)
+        return max(fetch_parallel, 0)
+
+    @property
+    def report_files(self):
+        """
+        The robot output files to retrieve, relative to the output
+        directory on the test instances.
+        """
+        files = []
+        defaults = (
+            ('output', 'output.xml'),
+            ('log', 'log.html'),
+            ('report', 'report.html'),
+        )
+        for option, default in defaults:
+            value = str(self.robot_options.get(option, default))
+            if value.upper() != 'NONE':
+                files.append(value)
+        return files
+
+    @property
+    def merge_reports(self):
+        return as_boolean(self.options.get('merge_reports', False))
+
+    @property
+    def rebot_options(self):
+        return self.options.get('rebot', {})
+
+    @property
+    def live_results(self):
+        return as_boolean(self.options.get('live_results', False)) or \
+            self.fail_fast
+
+    @property
+    def fail_fast(self):
+        return as_boolean(self.options.get('fail_fast', False))
+
+    @property
+    def gather_subset(self):
+        subset = self.options.get('gather_subset', GATHER_SUBSET)
+        if isinstance(subset, str):
+            return subset
+        return ','.join(subset)
+
+    @property
+    def fact_cache(self):
+        return as_boolean(self.options.get('fact_cache', True))
+
+    @property
+    def forks(self):
+        """
+        The number of Ansible forks of the verifier playbooks, or None to
+        use the provisioner forks.
+        """
+        forks = self.options.get('forks')
+        if forks is None:
+            return None
+        try:
+            forks = int(forks)
+        except (TypeError, ValueError):
+            util.sysexit_with_message('Invalid forks option %s' % forks, 1)
+        return max(forks, 1)
+
+    @property
+    def strategy(self):
+        strategy = self.options.get('strategy', 'free')
+        if strategy not in ('free', 'host_pinned', 'linear'):
+            util.sysexit_with_message(
+                'Invalid strategy option %s' % strategy, 1)
+        return strategy
+
+    @property
+    def pipelining(self):
+        return as_boolean(self.options.get('pipelining', True))
+
+    @property
+    def ssh_multiplex(self):
+        return as_boolean(self.options.get('ssh_multiplex', True))
+
+    @property
+    def ssh_control_persist(self):
+        return str(self.options.get('ssh_control_persist', '60s'))
+
+    @property
+    def ssh_control_path_dir(self):
+        """
+        The directory of the ssh master connection sockets.
+
+        Falls back to the Ansible default directory when the ephemeral
+        directory path is too long for a unix domain socket name, leaving
+        room for the socket name, which is the host name, port, and user
+        name, and the temporary suffix added by ssh.
+        """
+        directory = os.path.join(self._config.scenario.ephemeral_directory,
+                                 'cp')
+        if len(directory) > 48:
+            directory = os.path.expanduser('~/.ansible/cp')
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        return directory
+
     @property
     def robot_options(self):
         return self.options.get('robot', {})
@@ -265,8 +757,14 @@ class Robotframework(Verifier):
 
     @property
     def data_sources(self):
+        return self.test_data_sources(self.tests)
+
+    def test_data_sources(self, tests):
+        """
+        The robot data source paths of the given test sources.
+        """
         data_sources = []
-        for test in self.tests:
+        for test in tests:
             name = test.get('name', 'tests')
             enabled = as_boolean(test.get('enabled', 'yes'))
             if not enabled:
@@ -281,6 +779,472 @@ class Robotframework(Verifier):
         LOG.debug("data_sources=%s", data_sources)
         return data_sources
 
+    @property
+    def preflight(self):
+        """
+        The preflight check mode, ``dryrun`` or ``parse``, or None when the
+        preflight check is disabled.
+        """
+        mode = self.options.get('preflight', False)
+        if mode in ('dryrun', 'parse'):
+            return mode
+        return 'dryrun' if as_boolean(mode) else None
+
+    def run_preflight(self):
+        """
+        Check the tests on the controller before the test instances are
+        prepared.
+
+        The ``dir`` test sources and the resource files are staged in the
+        ephemeral directory in the same layout as on the test instances, then
+        ``robot --dryrun`` or the syntax check is run in a virtualenv on the
+        controller. The libraries are installed in the virtualenv only for
+        the dryrun.
+        """
+        import subprocess
+        from molecule_robotframework import preflight
+
+        mode = self.preflight
+        tests = [t for t in self.tests
+                 if as_boolean(t.get('enabled', 'yes'))
+                 and t.get('type', 'dir') == 'dir']
+        if not tests:
+            LOG.info('Skipping the preflight check; no dir test sources.')
+            return
+        packages = [str(r) for r in self.options.get(
+            'requirements', ['robotframework', 'pyyaml'])]
+        if mode == 'dryrun':
+            for library in self.options.get('libraries', []):
+                if isinstance(library, dict):
+                    library = library.get('name', library.get('file'))
+                if library:
+                    packages.append(str(library))
+        directory = os.path.join(self._config.scenario.ephemeral_directory,
+                                 'preflight')
+        try:
+            venv = preflight.prepare_venv(directory, packages)
+            staging = preflight.stage(directory, tests,
+                                      self.options.get('resources', []))
+        except (OSError, KeyError, subprocess.CalledProcessError) as e:
+            util.sysexit_with_message(
+                'Failed to prepare the preflight check: %s' % e, 1)
+        if mode == 'dryrun':
+            options = dict(self.robot_options)
+            if self._selection:
+                parseinclude = options.get('parseinclude', [])
+                if not isinstance(parseinclude, list):
+                    parseinclude = [parseinclude]
+                options['parseinclude'] = parseinclude + self._selection
+            data_sources = [ds.lstrip('/')
+                            for ds in self.test_data_sources(tests)]
+            cmd = preflight.dryrun_command(venv, options, data_sources)
+        else:
+            cmd = preflight.parse_command(venv, ['.'])
+        LOG.info(f'Running the preflight {mode} check on the controller.')
+        result = util.run_command(cmd, debug=self._config.debug,
+                                  env=self.env, cwd=staging)
+        if result.returncode != 0:
+            util.sysexit_with_message(
+                f'Preflight {mode} check failed; the test instances were '
+                'not prepared.', result.returncode)
+
+    @property
+    def sync_directory(self):
+        return os.path.join(self._config.scenario.ephemeral_directory, 'sync')
+
+    @property
+    def git_directory(self):
+        return os.path.join(self._config.scenario.ephemeral_directory, 'git')
+
+    @property
+    def rerunfailed(self):
+        return as_boolean(self.options.get('rerunfailed', False))
+
+    @property
+    def rerun_directory(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            'rerun')
+
+    def rerun_output(self, name):
+        """
+        The previous robot output file of a test instance to be uploaded to
+        rerun the failed tests, or None to run all the tests.
+        """
+        path = os.path.join(self.rerun_directory, f'{name}.xml')
+        if self.rerunfailed and os.path.isfile(path):
+            return path
+        return None
+
+    def prepare_rerun(self):
+        """
+        Save the robot output files retrieved by the previous verify in the
+        ephemeral directory, before they are replaced by the new ones, to be
+        uploaded by the verify playbook.
+        """
+        import shutil
+
+        if os.path.isdir(self.rerun_directory):
+            shutil.rmtree(self.rerun_directory)
+        if not self.rerunfailed:
+            return
+        os.makedirs(self.rerun_directory)
+        names = list(self.test_hosts)
+        for name in names:
+            path = self.host_output(name, flat=(len(names) == 1))
+            if path:
+                LOG.info(f'Rerunning failed tests of {path} on {name}.')
+                shutil.copyfile(path, os.path.join(self.rerun_directory,
+                                                   f'{name}.xml'))
+            else:
+                LOG.warning(f'Previous robot output file from {name} not '
+                            'found; running all tests.')
+
+    @property
+    def changed_only(self):
+        return as_boolean(self.options.get('changed_only', False))
+
+    @property
+    def selection_file(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            'selection.json')
+
+    def select_suites(self):
+        """
+        Find the test suites to be run when ``changed_only`` is set.
+
+        Returns the paths on the test instances of the suites which have not
+        passed with the same inputs, or None to run all the suites.
+        """
+        from molecule_robotframework import selection
+        from molecule_robotframework import sync
+
+        if not self.changed_only:
+            return None
+        suites = {}
+        search = []
+        for test in self.tests:
+            if not as_boolean(test.get('enabled', 'yes')):
+                continue
+            if test.get('type', 'dir') != 'dir':
+                LOG.warning('Running all test suites; changed suites can be '
+                            'found only for dir test sources.')
+                return None
+            name = test.get('name', 'tests')
+            source = test['source']
+            suites.update(selection.test_source_suites(name, source))
+            search.extend(path for path, _ in sync.walk_source(source))
+        suites = {k: v for k, v in suites.items()
+                  if any(selection.in_data_source(k, ds)
+                         for ds in self.data_sources)}
+        shared = [r['source'] for r in
+                  self.options.get('resources', []) +
+                  self.options.get('variablefiles', [])
+                  if isinstance(r, dict) and
+                  os.path.isfile(r.get('source', ''))]
+        libraries = []
+        for lib in self.options.get('libraries', []):
+            if isinstance(lib, dict) and 'file' in lib and \
+                    os.path.isfile(lib['file']):
+                libraries.append(sync.file_digest(lib['file']))
+            else:
+                libraries.append(lib)
+        common = selection.common_digest({
+            'robot': self.robot_options,
+            'requirements': self.options.get('requirements'),
+            'libraries': libraries,
+        })
+        index = selection.build_index(suites, shared + search, shared, common)
+
+        state = selection.load_state(self.selection_file)
+        state['index'] = index
+        selection.save_state(self.selection_file, state)
+        changed = selection.changed_suites(index, state.get('passed', {}))
+        LOG.info(f'{len(changed)} of {len(index)} test suites changed since '
+                 'the last passing verify.')
+        return changed
+
+    def save_passed_suites(self):
+        """
+        Save the input digests of the suites run by a passing verify.
+        """
+        from molecule_robotframework import selection
+
+        state = selection.load_state(self.selection_file)
+        index = state.get('index', {})
+        passed = state.setdefault('passed', {})
+        for suite in self._selection:
+            if suite in index:
+                passed[suite] = index[suite]['digest']
+        selection.save_state(self.selection_file, state)
+
+    @property
+    def timings(self):
+        return as_boolean(self.options.get('timings', False))
+
+    @property
+    def timings_db(self):
+        return self.options.get(
+            'timings_db',
+            os.path.join(self._config.scenario.directory, 'timings.db'))
+
+    @property
+    def timings_history(self):
+        """
+        The number of recent runs to average the test durations over.
+        """
+        history = self.options.get('timings_history', 5)
+        try:
+            history = int(history)
+        except (TypeError, ValueError):
+            history = 0
+        if history < 1:
+            util.sysexit_with_message(
+                'Invalid timings_history option %s; expected an integer of '
+                'at least 1' % self.options['timings_history'], 1)
+        return history
+
+    @property
+    def durations_file(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            'durations.json')
+
+    def prepare_durations(self):
+        """
+        Save the average test durations of the recent runs to be uploaded
+        by the verify playbook to balance the shards, and return the average
+        durations of the recent runs on each test instance.
+        """
+        from molecule_robotframework import timings
+
+        if os.path.exists(self.durations_file):
+            os.remove(self.durations_file)
+        if not self.timings or not os.path.exists(self.timings_db):
+            return {}
+        db = timings.Timings(self.timings_db, self.timings_history)
+        try:
+            if self.shards > 1:
+                with open(self.durations_file, 'w') as f:
+                    json.dump(db.test_durations(), f)
+            return db.host_durations()
+        finally:
+            db.close()
+
+    def record_timings(self, names, flat=False):
+        """
+        Record the test durations of the robot output files retrieved from
+        the test instances, then show the slowest tests and the tests which
+        are slower than in the recent runs.
+        """
+        from molecule_robotframework import timings
+
+        outputs = []
+        for name in names:
+            path = self.host_output(name, flat=flat)
+            if path:
+                outputs.append((name, path))
+            else:
+                LOG.warning(f'Robot output file from {name} not found.')
+        if not outputs:
+            return
+        db = timings.Timings(self.timings_db, self.timings_history)
+        try:
+            run = db.record(outputs)
+            slowest = db.slowest(run)
+            if slowest:
+                LOG.info('Slowest tests:')
+                for host, name, elapsed in slowest:
+                    LOG.info(f'  {elapsed:10.3f}s  {host}  {name}')
+            regressions = db.regressions(run)
+            if regressions:
+                LOG.warning('Tests slower than the average of the last '
+                            f'{self.timings_history} runs:')
+                for host, name, elapsed, average in regressions:
+                    LOG.warning(f'  {elapsed:10.3f}s (average {average:.3f}s)'
+                                f'  {host}  {name}')
+        finally:
+            db.close()
+
+    def prepare_test_sources(self):
+        """
+        Create the archives of the test sources installed with the archive
+        sync method.
+
+        The ``git`` test sources installed with the archive sync method are
+        checked out on the controller first, so git is not needed on the
+        test instances.
+        """
+        import subprocess
+        from molecule_robotframework import sync
+
+        for test in self.tests:
+            if not as_boolean(test.get('enabled', 'yes')):
+                continue
+            kind = test.get('type', 'dir')
+            if kind == 'git' and 'sync' in test:
+                if test['sync'] != 'archive':
+                    util.sysexit_with_message(
+                        'Invalid git test source sync method %s' %
+                        test['sync'], 1)
+            elif kind != 'dir':
+                continue
+            method = test.get('sync', 'copy')
+            if method not in ('copy', 'archive', 'rsync'):
+                util.sysexit_with_message(
+                    'Invalid test source sync method %s' % method, 1)
+            if method != 'archive':
+                continue
+            try:
+                if kind == 'git':
+                    clone = sync.git_checkout(
+                        test['source'], str(test.get('version', 'master')),
+                        self.git_directory)
+                    sync.prepare_archive(test.get('name', 'tests'),
+                                         clone + '/',
+                                         self.sync_directory,
+                                         excludes=('.git',),
+                                         origin=test['source'])
+                else:
+                    sync.prepare_archive(test.get('name', 'tests'),
+                                         test['source'],
+                                         self.sync_directory)
+            except subprocess.CalledProcessError as e:
+                util.sysexit_with_message(
+                    'Failed to checkout test source %s: %s' % (
+                        test['source'], e.stderr.decode().strip()), 1)
+            except (KeyError, OSError) as e:
+                util.sysexit_with_message(
+                    'Failed to prepare test source: %s' % e, 1)
+
+    @property
+    def image_cache(self):
+        return as_boolean(self.options.get('image_cache', False))
+
+    @property
+    def image_cache_name(self):
+        """
+        The repository name of the prepared test instance images.
+        """
+        default = f'molecule-robotframework-{self._config.scenario.name}'
+        return str(self.options.get('image_cache_name', default)).lower()
+
+    def image_cache_key(self):
+        """
+        The key of the prepared test instance images.
+
+        The key is the digest of the verifier options and of the files
+        installed by the verify playbook; the bundled playbooks and the
+        scenario verify playbook, the ``dir`` test sources, the resources and
+        variable files, and the local library packages.
+        """
+        from molecule_robotframework import selection
+        from molecule_robotframework import sync
+
+        files = {}
+
+        def add(path):
+            if os.path.isfile(path):
+                files[path] = sync.file_digest(path)
+            elif os.path.isdir(path):
+                files[path] = sync.manifest_digest({
+                    arcname: digest
+                    for arcname, digest in sync.manifest(path + '/').items()
+                    if '__pycache__' not in arcname})
+
+        add(os.path.join(os.path.dirname(__file__), 'playbooks'))
+        playbook = self.playbooks._get_playbook('verify')
+        if playbook:
+            add(playbook)
+        for test in self.tests:
+            if test.get('type', 'dir') == 'dir' and 'source' in test:
+                add(test['source'])
+        for item in self.options.get('resources', []) + \
+                self.options.get('variablefiles', []):
+            if isinstance(item, dict) and 'source' in item:
+                add(item['source'])
+        for library in self.options.get('libraries', []):
+            if isinstance(library, dict) and 'file' in library:
+                add(library['file'])
+        return selection.common_digest({
+            'options': self.options,
+            'files': files,
+        })
+
+    def image_transport(self, name, host):
+        """
+        The container transport of a test instance, or None when the
+        instance is not a docker or podman container.
+        """
+        from molecule_robotframework import transport
+
+        cls = transport.find(host.get('ansible_connection', 'ssh'))
+        if cls is None or not issubclass(cls, transport.Docker):
+            return None
+        return cls(name, host)
+
+    def prepared_hosts(self, key):
+        """
+        Find the test instances created from an image prepared with the
+        given key. Returns the remote home directory of each prepared
+        instance by instance name.
+        """
+        from molecule_robotframework import images
+
+        clients = {}
+        for name, host in self.test_hosts.items():
+            t = self.image_transport(name, host)
+            if t:
+                members = clients.setdefault(tuple(t.client()), [])
+                members.append((name, t.container))
+        prepared = {}
+        for client, members in clients.items():
+            labels = images.inspect_labels(
+                list(client), [container for _, container in members])
+            for name, container in members:
+                found = labels.get(container, {})
+                if found.get(images.LABEL_KEY) == key and \
+                        found.get(images.LABEL_HOME):
+                    prepared[name] = found[images.LABEL_HOME]
+        return prepared
+
+    def use_prepared_hosts(self, prepared):
+        """
+        Skip the verify playbook when every test instance was created from
+        a prepared image, and nothing is to be uploaded for this run.
+        """
+        if not prepared or set(prepared) != set(self.test_hosts):
+            return False
+        if os.path.exists(self.durations_file) or \
+                any(self.rerun_output(name) for name in prepared):
+            LOG.info('Running the verify playbook to upload the run files.')
+            return False
+        if any(test.get('type', 'dir') == 'git' for test in self.tests
+               if as_boolean(test.get('enabled', 'yes'))):
+            LOG.info('Running the verify playbook to update the git tests.')
+            return False
+        directory = self._config.scenario.ephemeral_directory
+        with open(os.path.join(directory, 'hostvars.json'), 'w') as f:
+            json.dump({name: {'home': home}
+                       for name, home in prepared.items()}, f)
+        return True
+
+    def save_image(self, key, prepared):
+        """
+        Save the first test instance prepared by the verify playbook as the
+        prepared image of the scenario.
+        """
+        from molecule_robotframework import images
+
+        for name, host in self.test_hosts.items():
+            t = self.image_transport(name, host)
+            if not t or name in prepared:
+                continue
+            images.commit(
+                t.client(), t.container,
+                [f'{self.image_cache_name}:{key[:12]}',
+                 f'{self.image_cache_name}:latest'],
+                {images.LABEL_KEY: key, images.LABEL_HOME: self.home(name)})
+            return
+
     @property
     def test_hosts(self):
         inventory = self._config.provisioner.inventory
@@ -292,17 +1256,36 @@ class Robotframework(Verifier):
         return os.path.join(self._config.scenario.ephemeral_directory,
                             'robotrc')
 
-    @property
-    def hostvars(self):
+    def load_hostvars(self):
         """
-        The verify playbook saves the collected host variables
+        Read the host variables saved by the verify playbook.
+
+        The verify playbook saves the host variables needed by the verifier
         to a json file in the ephemeral directory.
         """
         directory = self._config.scenario.ephemeral_directory
         filename = os.path.join(directory, 'hostvars.json')
         with open(filename) as f:
-            hostvars = json.load(f)
-        return hostvars
+            self._hostvars = json.load(f)
+
+    @property
+    def hostvars(self):
+        """
+        The host variables saved by the verify playbook, cached for the run.
+        """
+        if self._hostvars is None:
+            self.load_hostvars()
+        return self._hostvars
+
+    def home(self, name):
+        """
+        The home directory of the remote user on a test instance.
+        """
+        hostvars = self.hostvars[name]
+        if 'home' in hostvars:
+            return hostvars['home']
+        # Complete host variables saved by a custom verify playbook.
+        return hostvars['ansible_env']['HOME']
 
     def bake(self, name, host):
         """
@@ -310,40 +1293,360 @@ class Robotframework(Verifier):
         """
 
         # The robot command line.
-        home = self.hostvars[name]['ansible_env']['HOME']
-        robot_cmd = [
-            os.path.join(home, '.robotframework_venv/bin/robot'),
-            *dict2args(self.robot_options),
-            *self.data_sources  # last
-        ]
+        home = self.home(name)
+        venv = os.path.join(home, '.robotframework_venv')
+        rerun = self.rerun_output(name)
+        if self.shards > 1 or rerun:
+            robot_cmd = [
+                os.path.join(venv, 'bin/python'),
+                os.path.join(venv, 'robot_runner.py'),
+                '--shards', str(self.shards),
+                '--shard-by', self.shard_by,
+            ]
+            if rerun:
+                robot_cmd.extend([
+                    '--rerun',
+                    os.path.join(home, '.robotframework_rerun.xml'),
+                ])
+            if os.path.exists(self.durations_file):
+                robot_cmd.extend([
+                    '--durations',
+                    os.path.join(venv, 'durations.json'),
+                ])
+            robot_cmd.append('--')
+        else:
+            robot_cmd = [os.path.join(venv, 'bin/robot')]
+        robot_cmd.extend(dict2args(self.robot_options))
+        if self.live_results:
+            robot_cmd.extend([
+                '--listener', os.path.join(venv, 'robot_listener.py'),
+            ])
+        for suite in self._selection or []:
+            robot_cmd.extend(['--parseinclude', suite])
+        robot_cmd.extend(self.data_sources)  # last
         LOG.info('robot command: %s' % ' '.join(robot_cmd))
 
+        cmd = self.remote_command(name, host, robot_cmd,
+                                  interactive=self.live_results)
+        self._robot_command = cmd
+        return cmd
+
+    def remote_command(self, name, host, argv, interactive=False):
+        """
+        Prepare a command to run a program on a test instance.
+
+        The stdin of the command is forwarded to the program when
+        ``interactive`` is set.
+        """
+        from molecule_robotframework import transport
+
         ansible_connection = host.get('ansible_connection', 'ssh')
-        if 'docker' in ansible_connection:
-            cmd = ['docker', 'exec', name, *robot_cmd]
-        elif 'ssh' in ansible_connection or 'smart' in ansible_connection:
-            ssh_host = host.get('ansible_host', name)
-            ssh_user = host.get('ansible_user', None)
-            ssh_port = host.get('ansible_port', None)
-            ssh_ident = host.get('ansible_private_key_file', None)
-            ssh_args = host.get('ansible_ssh_common_args', '').split()
-            if ssh_port:
-                ssh_args.extend(['-p', str(ssh_port)])
-            if ssh_ident:
-                ssh_args.extend(['-i', ssh_ident])
-            if ssh_user:
-                ssh_dest = '@'.join([ssh_user, ssh_host])
+        cls = transport.find(ansible_connection)
+        if cls is None:
+            util.sysexit_with_message(
+                'Unsupported connection %s' % (ansible_connection,), 1)
+        options = {}
+        if cls is transport.Ssh and self.ssh_multiplex:
+            options = {
+                'control_path_dir': self.ssh_control_path_dir,
+                'control_persist': self.ssh_control_persist,
+            }
+        return cls(name, host, **options).command(argv, interactive)
+
+    def stream_report(self, name, host, dest):
+        """
+        Stream the report files of a test instance to the controller.
+
+        The report files are packed into a compressed tar stream by running
+        ``tar`` on the test instance over the same connection used to run
+        ``robot``, and are unpacked as they are received.
+        """
+        import subprocess
+        import tarfile
+
+        # Relative paths are relative to the working directory of the robot
+        # command, which is run the same way.
+        outputdir = str(self.robot_options.get('outputdir', '.'))
+        argv = ['tar', 'czf', '-', '-C', outputdir, *self.report_files]
+        debugfile = self.robot_options.get('debugfile')
+        if debugfile and str(debugfile).upper() != 'NONE':
+            debugfile = str(debugfile)
+            argv.extend(['-C', os.path.dirname(debugfile) or '.',
+                         os.path.basename(debugfile)])
+        cmd = self.remote_command(name, host, argv)
+        LOG.info(f'Streaming report files from instance {name} to {dest}.')
+        os.makedirs(dest, exist_ok=True)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, env=self.env,
+                                cwd=self._config.scenario.directory)
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode='r|gz') as tar:
+                if hasattr(tarfile, 'data_filter'):
+                    tar.extractall(dest, filter='data')
+                else:
+                    tar.extractall(dest)
+        except tarfile.TarError as e:
+            LOG.error(f'Failed to unpack report files from {name}: {e}')
+        finally:
+            proc.stdout.close()
+        returncode = proc.wait()
+        if returncode != 0:
+            LOG.error(f'Failed to retrieve report files from {name}.')
+        return returncode
+
+    def fetch_report(self, name, host, count):
+        """
+        Retrieve the report files from one test instance and return the
+        exit code of the download.
+
+        The report files are saved in a subdirectory named after the
+        instance when there are ``count`` > 1 test instances.
+        """
+        LOG.info(f'Download report files from instance {name}.')
+        if self.fetch_method == 'stream':
+            dest = self.dest_dir
+            if count > 1:
+                dest = os.path.join(dest, name)
+            with self._phases.phase('fetch', name):
+                return self.stream_report(name, host, dest)
+        returncode = self.run_fetch_playbook(
+            limit=name,
+            extra_vars={'molecule_robotframework_host_count': count})
+        if returncode != 0:
+            LOG.error(f'Failed to retrieve report files from {name}.')
+        return returncode
+
+    def run_fetch_playbook(self, limit=None, extra_vars=None):
+        """
+        Run the fetch report playbook and return the ansible exit code.
+
+        Molecule exits when a playbook fails, while newer versions of
+        molecule raise a MoleculeError instead.
+        """
+        try:
+            from molecule.exceptions import MoleculeError
+        except ImportError:
+            MoleculeError = SystemExit
+        try:
+            self.execute_playbook('verify_fetch_report', limit=limit,
+                                  extra_vars=extra_vars)
+        except (SystemExit, MoleculeError) as e:
+            code = getattr(e, 'code', None)
+            return code if isinstance(code, int) and code else 1
+        return 0
+
+    def fetch_reports(self, hosts, skipped=()):
+        """
+        Retrieve the report files from the test instances, except the
+        ``skipped`` instances where robot was not run.
+
+        Returns the exit code of the download of each instance. The reports
+        of all the instances are downloaded by one playbook run, unless the
+        stream method is used, so a failed playbook fails every instance.
+        """
+        LOG.info('Download report files.')
+        names = [n for n, _ in hosts if n not in skipped]
+        if not names:
+            return {}
+        if self.fetch_method != 'stream':
+            if not skipped:
+                returncode = self.run_fetch_playbook()
             else:
-                ssh_dest = ssh_host
-            LOG.info('ssh command: %s' % ' '.join(
-                ['ssh', *ssh_args, ssh_dest]))
+                returncode = self.run_fetch_playbook(
+                    limit=','.join(names),
+                    extra_vars={'molecule_robotframework_host_count':
+                                len(hosts)})
+            if returncode != 0:
+                LOG.error('Failed to retrieve report files.')
+            return {name: returncode for name in names}
+        return {name: self.fetch_report(name, host, len(hosts))
+                for name, host in hosts if name not in skipped}
+
+    def host_output(self, name, flat=False):
+        """
+        Find the robot output file retrieved from a test instance.
 
-            cmd = ['ssh', *ssh_args, ssh_dest, *robot_cmd]
+        The ``fetch`` module keeps the path of the output directory on the
+        test instance, while the archive and stream methods do not. The report
+        files are saved directly in ``dest_dir`` (``flat``) when there is only
+        one test instance.
+        """
+        output = str(self.robot_options.get('output', 'output.xml'))
+        outputdir = str(self.robot_options.get('outputdir', '.'))
+        if flat:
+            candidates = [
+                os.path.join(self.dest_dir, output),
+                os.path.join(self.dest_dir, os.path.basename(output)),
+            ]
         else:
-            util.sysexit_with_message(
-                'Unsupported connection %s' % (ansible_connection,), 1)
+            candidates = [
+                os.path.join(self.dest_dir, name, output),
+                os.path.join(self.dest_dir, name, outputdir.lstrip('/'),
+                             output),
+            ]
+        for path in candidates:
+            if os.path.isfile(path):
+                return os.path.normpath(path)
+        return None
+
+    def merge_host_reports(self, names):
+        """
+        Merge the robot output files retrieved from the test instances into
+        a single output file, then write the log and report with ``rebot``.
+        """
+        import sys
+        import importlib.util
+        from xml.sax import SAXException
+        from molecule_robotframework import merge
+
+        output = str(self.robot_options.get('output', 'output.xml'))
+        if output.upper() == 'NONE':
+            LOG.warning('Unable to merge reports; robot output is disabled.')
+            return
+        outputs = []
+        for name in names:
+            path = self.host_output(name)
+            if path:
+                outputs.append((name, path))
+            else:
+                LOG.warning(f'Robot output file from {name} not found.')
+        if not outputs:
+            return
 
-        self._robot_command = cmd
+        LOG.info('Merge report files.')
+        name = self.rebot_options.get('name', self._config.scenario.name)
+        merged = os.path.join(self.dest_dir, os.path.basename(output))
+        try:
+            stats = merge.merge_outputs(outputs, merged, name)
+        except (OSError, ValueError, SAXException) as e:
+            LOG.error(f'Failed to merge robot output files: {e}')
+            return
+        LOG.info(f'Merged robot output file: {merged} '
+                 f'({stats.passed} passed, {stats.failed} failed, '
+                 f'{stats.skipped} skipped)')
+
+        options = {'outputdir': self.dest_dir, 'output': 'NONE'}
+        for option, default in (('log', 'log.html'),
+                                ('report', 'report.html')):
+            value = str(self.robot_options.get(option, default))
+            if value.upper() != 'NONE':
+                value = os.path.basename(value)
+            options[option] = value
+        options.update(self.rebot_options)
+        if all(str(options.get(o)).upper() == 'NONE'
+               for o in ('log', 'report', 'xunit')):
+            return
+        if importlib.util.find_spec('robot') is None:
+            LOG.warning('Robot Framework is not installed on the controller; '
+                        'skipping the merged log and report.')
+            return
+        cmd = [sys.executable, '-m', 'robot.rebot']
+        cmd.extend(dict2args(options))
+        cmd.append(merged)
+        result = util.run_command(cmd, debug=self._config.debug,
+                                  env=self.env)
+        if result.returncode > 250:
+            LOG.error(f'Failed to run command: {cmd}')
+
+    def verify_host(self, name, host, count, prefix=False, fetch_pool=None):
+        """
+        Run robot on a test instance and add the result, then start the
+        download of the report files of the instance when a fetch pool is
+        given.
+
+        Returns None when the instance is skipped after a fail fast abort.
+        """
+        import time
+
+        if self._live and self._live.aborted.is_set():
+            LOG.warning(f'Fail fast: skipping instance {name}.')
+            self._results.skip(name)
+            return None
+        start = time.time()
+        returncode = self.run_robot(name, host, prefix=prefix)
+        self._results.add(name, returncode, time.time() - start)
+        if fetch_pool:
+            self._fetches.append(
+                (name, fetch_pool.submit(self.fetch_report, name, host,
+                                         count)))
+        return returncode
+
+    def run_robot(self, name, host, prefix=False):
+        """
+        Run robot on a test instance and return the robot exit code.
+
+        The live output is prefixed with the instance name when ``prefix`` is
+        set, so the output of concurrent runs can be told apart.
+        """
+        with self._phases.phase('robot', name):
+            returncode = self._run_robot(name, host, prefix)
+        LOG.info(f"robot return code on instance {name}: {returncode}")
+        return returncode
+
+    def _run_robot(self, name, host, prefix):
+        import sys
+        import subprocess
+
+        cmd = self.bake(name, host)
+        LOG.info(f'Running robotframework tests on instance {name}.')
+        if self._live:
+            returncode = self.run_live(name, cmd, prefix)
+        elif prefix:
+            proc = subprocess.Popen(
+                cmd,
+                cwd=self._config.scenario.directory,
+                env=self.env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors='replace',
+            )
+            for line in proc.stdout:
+                with self._output_lock:
+                    sys.stdout.write(f'[{name}] {line}')
+                    sys.stdout.flush()
+            returncode = proc.wait()
+        else:
+            result = util.run_command(
+                cmd,
+                debug=self._config.debug,
+                cwd=self._config.scenario.directory,
+                env=self.env
+            )
+            returncode = result.returncode
+        if returncode != 0:
+            LOG.error(f"Failed to run command: {cmd}")
+        return returncode
+
+    def run_live(self, name, cmd, prefix):
+        """
+        Run robot and handle the live result records of the listener.
+        """
+        import sys
+        import subprocess
+
+        def write(line):
+            with self._output_lock:
+                sys.stdout.write(f'[{name}] {line}' if prefix else line)
+                sys.stdout.flush()
+
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self._config.scenario.directory,
+            env=self.env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace',
+        )
+        self._live.start(name, proc)
+        try:
+            self._live.relay(name, proc.stdout, write)
+        finally:
+            self._live.finish(name)
+        returncode = proc.wait()
+        LOG.info(f'Results on instance {name}: {self._live.summary(name)}')
+        return returncode
 
     def execute(self, action_args=None):
         """
@@ -351,47 +1654,178 @@ class Robotframework(Verifier):
 
         First run the verify playbook (if provided) to install
         robotframework, libraries, and test data. Next, run ``robot`` on each
-        host in the test group (``all`` by default). Show the live output of
-        the ``robot`` command. Finally, run an optional playbook called
-        ``verify_fetch_report`` to retrieve the ``robot`` output files.
+        host in the test group (``all`` by default), up to ``parallel`` hosts
+        at a time. Show the live output of the ``robot`` command. Finally, run
+        an optional playbook called ``verify_fetch_report`` to retrieve the
+        ``robot`` output files.
         """
+        from molecule_robotframework import phases
+
         if not self.enabled:
             LOG.warning('Skipping, verifier is disabled.')
             return
 
-        # Save the robot args to a file in our ephemeral directory before
-        # running the verify playbook.
-        with open(self.argumentfile, 'w') as fh:
-            fh.writelines(dict2lines(self.robot_options))
+        self._phases = phases.Phases()
+        try:
+            with self._phases.phase('total'):
+                self.verify()
+        finally:
+            self.report_phases()
 
-        LOG.info('Prepare for verification.')
-        self.execute_playbook('verify')
+    def report_phases(self):
+        """
+        Save the phase durations to the ephemeral directory and show the
+        summary.
+        """
+        path = os.path.join(self._config.scenario.ephemeral_directory,
+                            'phases.json')
+        self._phases.save(path)
+        LOG.info(f'Verifier phase durations (saved to {path}):')
+        for line in self._phases.summary():
+            LOG.info(f'  {line}')
+
+    def verify(self):
+        """
+        Run the verifier phases.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from molecule_robotframework import live
+        from molecule_robotframework import results
+
+        with self._phases.phase('prepare'):
+            # Save the robot args to a file in our ephemeral directory before
+            # running the verify playbook.
+            with open(self.argumentfile, 'w') as fh:
+                fh.writelines(dict2lines(self.robot_options))
+            self._selection = self.select_suites()
+            if self._selection == []:
+                LOG.info('Skipping, no test suites changed since the last '
+                         'passing verify.')
+                return
+            self.prepare_test_sources()
+            self.prepare_rerun()
+            durations = self.prepare_durations()
+
+        if self.preflight:
+            with self._phases.phase('preflight'):
+                self.run_preflight()
+
+        key = None
+        prepared = {}
+        if self.image_cache:
+            with self._phases.phase('image lookup'):
+                key = self.image_cache_key()
+                prepared = self.prepared_hosts(key)
+        if self.use_prepared_hosts(prepared):
+            LOG.info('Skipping the verify playbook; the test instances were '
+                     f'created from the prepared image {key[:12]}.')
+            self.load_hostvars()
+        else:
+            LOG.info('Prepare for verification.')
+            self.execute_playbook('verify')
+            self.load_hostvars()
+            if key:
+                with self._phases.phase('image save'):
+                    self.save_image(key, prepared)
 
         LOG.info('Running robotframework verifier tests.')
-        verified = None
-        for name, host in self.test_hosts.items():
-            self.bake(name, host)
-            LOG.info(f'Running robotframework tests on instance {name}.')
-            result = util.run_command(
-                self._robot_command,
-                debug=self._config.debug,
-                cwd=self._config.scenario.directory,
-                env=self.env
-            )
-            LOG.info(f"robot return code: {result.returncode}")
-            if result.returncode == 0:
-                verified = True
-            else:
-                verified = False
-                LOG.error(f"Failed to run command: {result.args}")
+        hosts = list(self.test_hosts.items())
+        if durations:
+            # Start the longest running instances first.
+            hosts.sort(key=lambda h: durations.get(h[0], 0), reverse=True)
+        workers = min(self.parallel, len(hosts))
+        self._results = results.Results()
+        self._live = None
+        if self.live_results:
+            self._live = live.LiveResults(fail_fast=self.fail_fast)
+        fetch_pool = None
+        self._fetches = []
+        if self.fetch_parallel:
+            # Download the reports of each instance as soon as robot is done.
+            fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_parallel)
+        if workers > 1:
+            LOG.info(f'Running robot on {workers} instances at a time.')
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self.verify_host, name, host, len(hosts),
+                                prefix=True, fetch_pool=fetch_pool)
+                    for name, host in hosts
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for name, host in hosts:
+                self.verify_host(name, host, len(hosts),
+                                 fetch_pool=fetch_pool)
+        skipped = self._results.skipped()
+
+        if fetch_pool:
+            LOG.info('Waiting for report file downloads.')
+            fetch_pool.shutdown(wait=True)
+            fetched = {name: future.result()
+                       for name, future in self._fetches}
+        else:
+            fetched = self.fetch_reports(hosts, skipped)
+        for name, returncode in fetched.items():
+            if returncode != 0:
+                self._results.fetch_failed(name, returncode)
+        flat = len(hosts) == 1
+        names = self._results.ran()
 
-        LOG.info('Download report files.')
-        self.execute_playbook('verify_fetch_report')
+        if self.timings:
+            with self._phases.phase('timings'):
+                self.record_timings(names, flat)
+
+        if self.merge_reports and len(names) > 1:
+            with self._phases.phase('merge'):
+                self.merge_host_reports(names)
 
-        if verified:
+        self.report_results(names, flat)
+
+        if self._results.passed and self._selection:
+            self.save_passed_suites()
+
+        if self._results.passed:
             LOG.info('Verifier completed successfully.')
+        elif not hosts:
+            util.sysexit_with_message(
+                'Verification failed; no test instances found.', 1)
         else:
-            LOG.error('Verification failed.')
+            message = 'Verification failed on instances: %s' % \
+                ', '.join(self._results.failed())
+            if skipped:
+                message += '; skipped instances: %s' % ', '.join(skipped)
+            util.sysexit_with_message(message, self._results.exit_code)
+
+    def report_results(self, names, flat=False):
+        """
+        Add the test counts of each instance to the results, then save the
+        results to the ephemeral directory and show the summary.
+
+        The counts are the live results when enabled, otherwise the totals
+        of the robot output files retrieved from the test instances.
+        """
+        import xml.etree.ElementTree as ET
+        from molecule_robotframework import results
+
+        for name in names:
+            if self._live:
+                counts = self._live.counts.get(name)
+            else:
+                counts = None
+                path = self.host_output(name, flat=flat)
+                if path:
+                    try:
+                        counts = results.read_totals(path)
+                    except ET.ParseError as e:
+                        LOG.warning(f'Unable to read {path}: {e}')
+            self._results.set_counts(name, counts)
+        path = os.path.join(self._config.scenario.ephemeral_directory,
+                            'results.json')
+        self._results.save(path)
+        LOG.info(f'Verifier results (saved to {path}):')
+        for line in self._results.summary():
+            LOG.info(f'  {line}')
 
     def schema(self):
         return {
@@ -0,0 +1,62 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Robot Framework Verifier Schema Registration."""
+
+from collections.abc import Mapping
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+NAME = 'molecule-robotframework'
+
+# A verifier name accepted by the molecule schema.
+KNOWN_NAME = 'ansible'
+
+
+def register():
+    """
+    Accept our verifier name in the molecule schema validation.
+
+    The verifier names are hardcoded in the molecule schema file. Instead of
+    changing the installed schema file, the molecule schema validation is
+    wrapped to validate our verifier section as a known verifier. Molecule
+    loads the verifier plugins before the schema is validated.
+    """
+    try:
+        from molecule.model import schema_v3
+    except ImportError:
+        LOG.debug('Unable to register the verifier schema.')
+        return
+    original = getattr(schema_v3, 'validate', None)
+    if original is None or getattr(original, 'robotframework', False):
+        return
+
+    def validate(c, *args, **kwargs):
+        verifier = c.get('verifier') if isinstance(c, Mapping) else None
+        if isinstance(verifier, Mapping) and verifier.get('name') == NAME:
+            c = dict(c, verifier=dict(verifier, name=KNOWN_NAME))
+        return original(c, *args, **kwargs)
+
+    validate.robotframework = True
+    validate.__doc__ = original.__doc__
+    schema_v3.validate = validate
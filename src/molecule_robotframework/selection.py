@@ -0,0 +1,226 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Changed Test Suite Selection."""
+
+import hashlib
+import json
+import os
+import re
+
+from molecule import logger
+
+from molecule_robotframework.sync import file_digest, walk_source
+
+
+LOG = logger.get_logger(__name__)
+
+SUITE_EXTENSIONS = ('.robot', '.rbt', '.robot.rst')
+IMPORT_SETTINGS = ('library', 'resource', 'variables')
+
+SECTION = re.compile(r'^\*+\s*(\w[\w ]*?)\s*\**\s*$')
+SEPARATOR = re.compile(r'\s+\|\s+|\t+| {2,}')
+VARIABLE = re.compile(r'[$@&%]\{[^}]*\}')
+
+
+def is_suite(path):
+    name = os.path.basename(path)
+    return name.endswith(SUITE_EXTENSIONS) and not name.startswith('_')
+
+
+def parse_imports(path):
+    """
+    Read the library, resource, and variable file imports in the settings
+    section of a robot data file.
+
+    Returns a list of (setting, name) tuples. This is a lightweight parser
+    which only needs to find the import names, so robot is not required on
+    the controller.
+    """
+    imports = []
+    settings = False
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.rstrip()
+                if line.startswith('|'):
+                    line = line.strip('| ')
+                match = SECTION.match(line)
+                if match:
+                    settings = match.group(1).lower() in ('setting',
+                                                          'settings')
+                    continue
+                if not settings or not line or line[0].isspace():
+                    continue
+                cells = SEPARATOR.split(line)
+                if len(cells) > 1 and cells[0].lower() in IMPORT_SETTINGS:
+                    imports.append((cells[0].lower(), cells[1].strip()))
+    except OSError as e:
+        LOG.warning(f'Unable to read {path}: {e}')
+    return imports
+
+
+class Resolver:
+    """
+    Find the controller files of the robot data file imports.
+
+    Imports are looked up relative to the importing file first, then by
+    base name in the given search files, which are the installed resources,
+    variable files, and test files. Imports which cannot be found, such as
+    libraries installed with pip, are ignored.
+    """
+
+    def __init__(self, search):
+        self.search = {}
+        for path in search:
+            name = os.path.basename(path)
+            if name.endswith('.j2'):
+                name = name[:-3]
+            self.search.setdefault(name, path)
+
+    def resolve(self, setting, name, directory):
+        name = name.replace('${CURDIR}', directory)
+        if VARIABLE.search(name):
+            return None
+        if setting == 'library' and not name.endswith('.py') and \
+                '/' not in name:
+            candidates = [f'{name.replace(".", "/")}.py',
+                          f'{name.replace(".", "/")}/__init__.py']
+        else:
+            candidates = [name]
+        for candidate in candidates:
+            path = os.path.normpath(os.path.join(directory, candidate))
+            if os.path.isfile(path):
+                return path
+        for candidate in candidates:
+            path = self.search.get(os.path.basename(candidate))
+            if path:
+                return path
+        return None
+
+    def dependencies(self, path):
+        """
+        Find the files a robot data file depends on, including the imports
+        of the imported resource files.
+        """
+        found = set()
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            directory = os.path.dirname(current)
+            for setting, name in parse_imports(current):
+                dep = self.resolve(setting, name, directory)
+                if dep and dep not in found and dep != path:
+                    found.add(dep)
+                    if setting == 'resource':
+                        pending.append(dep)
+        return found
+
+
+def build_index(suites, search, shared, common):
+    """
+    Compute the input digest of each suite.
+
+    ``suites`` maps the suite paths on the test instances to a list of
+    controller files of the suite, which are the suite file and the parent
+    suite initialization files. ``search`` is the list of controller files
+    to lookup imports by name. The ``shared`` files which are not imported
+    by any suite, such as variable files given in the robot options, are
+    inputs of every suite. ``common`` is a digest of the other inputs shared
+    by all suites, such as the robot options and libraries.
+    """
+    resolver = Resolver(search)
+    inputs = {}
+    for suite, files in suites.items():
+        inputs[suite] = set()
+        for path in files:
+            inputs[suite].add(path)
+            inputs[suite].update(resolver.dependencies(path))
+    imported = set().union(*inputs.values())
+    unused = [p for p in shared if p not in imported]
+
+    digests = {}
+    index = {}
+    for suite in suites:
+        files = sorted(inputs[suite].union(unused))
+        h = hashlib.sha1(common.encode('utf-8'))
+        for path in files:
+            if path not in digests:
+                digests[path] = file_digest(path)
+            h.update(f'{path}\0{digests[path]}\0'.encode('utf-8'))
+        index[suite] = {'inputs': files, 'digest': h.hexdigest()}
+    return index
+
+
+def test_source_suites(name, source):
+    """
+    Find the suite files of a test source.
+
+    Returns a dictionary mapping the suite paths on the test instances to
+    the controller suite file and the initialization files of the parent
+    suites.
+    """
+    files = dict((os.path.join(name, arcname), path)
+                 for path, arcname in walk_source(source))
+    suites = {}
+    for remote, path in files.items():
+        if not is_suite(remote):
+            continue
+        inits = []
+        parent = os.path.dirname(remote)
+        while parent:
+            for ext in SUITE_EXTENSIONS:
+                init = files.get(os.path.join(parent, f'__init__{ext}'))
+                if init:
+                    inits.append(init)
+            parent = os.path.dirname(parent)
+        suites[remote] = [path] + inits
+    return suites
+
+
+def in_data_source(suite, data_source):
+    data_source = os.path.normpath(data_source)
+    return suite == data_source or suite.startswith(data_source + '/')
+
+
+def common_digest(data):
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def load_state(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path, state):
+    with open(path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def changed_suites(index, passed):
+    """
+    The suites which have not passed with the same inputs.
+    """
+    return [suite for suite, entry in sorted(index.items())
+            if passed.get(suite) != entry['digest']]
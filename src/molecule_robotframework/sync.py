@@ -0,0 +1,150 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Test Source Archives."""
+
+import hashlib
+import json
+import os
+import subprocess
+import tarfile
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+
+def source_key(name, source):
+    """
+    The archive file name key of a test source.
+
+    Note: The verify playbook computes the same key with the ``hash`` filter
+    to find the archive, so keep these in sync.
+    """
+    return hashlib.sha1((name + source).encode('utf-8')).hexdigest()
+
+
+def file_digest(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def walk_source(source, excludes=()):
+    """
+    Find the files to be installed from a test source.
+
+    Yields (path, arcname) tuples, where arcname is the path relative to the
+    test source destination directory. Follows the ``copy`` module
+    conventions; the contents of a directory are installed when the source
+    path ends with a slash, otherwise the directory itself is installed.
+    Directories named in ``excludes`` are skipped.
+    """
+    if os.path.isfile(source):
+        yield source, os.path.basename(source)
+        return
+    top = os.path.normpath(source)
+    if source.endswith('/'):
+        prefix = ''
+    else:
+        prefix = os.path.basename(top)
+    for root, dirs, files in os.walk(top):
+        dirs[:] = sorted(d for d in dirs if d not in excludes)
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            arcname = os.path.join(prefix, os.path.relpath(path, top))
+            yield path, arcname
+
+
+def manifest(source, excludes=()):
+    """
+    Map the installed file names of a test source to their checksums.
+    """
+    return {arcname: file_digest(path)
+            for path, arcname in walk_source(source, excludes)}
+
+
+def manifest_digest(data):
+    text = json.dumps(data, sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def prepare_archive(name, source, directory, excludes=(), origin=None):
+    """
+    Create the test source archive to be unpacked on the test instances.
+
+    The archive and the digest of the test source manifest are saved in
+    the given directory. The archive is only rebuilt when the manifest
+    changes. The archive is keyed by the ``origin`` test source, when the
+    test files were retrieved from the origin to the ``source`` path.
+    Returns the manifest digest.
+    """
+    if not os.path.exists(source):
+        raise FileNotFoundError(f'Test source {source} not found.')
+    os.makedirs(directory, exist_ok=True)
+    key = source_key(name, origin or source)
+    archive = os.path.join(directory, f'{key}.tar.gz')
+    digest_file = os.path.join(directory, f'{key}.digest')
+
+    digest = manifest_digest(manifest(source, excludes))
+    previous = None
+    if os.path.exists(digest_file) and os.path.exists(archive):
+        with open(digest_file) as f:
+            previous = f.read().strip()
+    if digest == previous:
+        LOG.info(f'Test source {source} is unchanged.')
+        return digest
+
+    LOG.info(f'Creating archive of test source {source}.')
+    with tarfile.open(archive, 'w:gz') as tar:
+        for path, arcname in walk_source(source, excludes):
+            tar.add(path, arcname=arcname, recursive=False)
+    with open(digest_file, 'w') as f:
+        f.write(digest + '\n')
+    return digest
+
+
+def git_checkout(source, version, directory):
+    """
+    Retrieve a version of a git test source on the controller.
+
+    The version, which may be a branch, tag, or commit, is fetched without
+    history into a clone in the given directory. The clone is kept for each
+    repository and version, so later checkouts fetch only the new commits.
+    Returns the clone path.
+    """
+    key = hashlib.sha1(f'{source}#{version}'.encode('utf-8')).hexdigest()
+    clone = os.path.join(directory, key)
+
+    def git(*args):
+        subprocess.run(['git', '-C', clone, *args], check=True,
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    if not os.path.isdir(os.path.join(clone, '.git')):
+        os.makedirs(clone, exist_ok=True)
+        git('init', '--quiet')
+        git('remote', 'add', 'origin', source)
+    LOG.info(f'Fetching {version} of test source {source}.')
+    git('fetch', '--quiet', '--depth', '1', 'origin', version)
+    git('checkout', '--quiet', '--force', '--detach', 'FETCH_HEAD')
+    return clone
@@ -0,0 +1,210 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Robot Framework Test Timings."""
+
+import datetime
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run INTEGER NOT NULL REFERENCES runs(id),
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT,
+    elapsed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_name ON results (kind, name, run);
+"""
+
+ROBOT6_TIME = '%Y%m%d %H:%M:%S.%f'
+
+
+def elapsed(status):
+    """
+    The elapsed seconds of a status element.
+    """
+    if 'elapsed' in status:
+        # Robot Framework 7 and later.
+        return float(status['elapsed'])
+    start = status.get('starttime', 'N/A')
+    end = status.get('endtime', 'N/A')
+    if 'N/A' in (start, end):
+        return 0.0
+    delta = datetime.datetime.strptime(end, ROBOT6_TIME) - \
+        datetime.datetime.strptime(start, ROBOT6_TIME)
+    return delta.total_seconds()
+
+
+def read_output(path):
+    """
+    Read the suite and test durations from a robot output file.
+
+    The output file is parsed incrementally and the parsed elements are
+    discarded as soon as they are done. Yields (kind, level, name, status,
+    elapsed) tuples, where level is the suite depth and name is the full
+    name of the suite or test.
+    """
+    names = []
+    stack = []
+    status = {}
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if 'statistics' in stack or elem.tag == 'statistics':
+            # The statistics have suite elements too.
+            if event == 'start':
+                stack.append(elem.tag)
+            else:
+                stack.pop()
+                elem.clear()
+            continue
+        if event == 'start':
+            if elem.tag == 'suite':
+                names.append(elem.get('name', ''))
+            elif elem.tag == 'test' and stack and stack[-1] == 'suite':
+                names.append(elem.get('name', ''))
+            stack.append(elem.tag)
+            continue
+        stack.pop()
+        parent = stack[-1] if stack else None
+        if elem.tag == 'status' and parent in ('suite', 'test'):
+            status[len(stack)] = dict(elem.attrib)
+        elif elem.tag in ('suite', 'test') and \
+                (elem.tag == 'suite' or parent == 'suite'):
+            attrs = status.pop(len(stack) + 1, {})
+            level = sum(1 for t in stack if t == 'suite')
+            if elem.tag == 'suite':
+                level += 1
+            yield (elem.tag, level, '.'.join(names), attrs.get('status'),
+                   elapsed(attrs))
+            names.pop()
+        elem.clear()
+
+
+class Timings:
+    """
+    The timing history of the suites and tests of a scenario, saved in a
+    SQLite database.
+    """
+
+    def __init__(self, path, history=5):
+        self.path = path
+        self.history = history
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def recent_runs(self, before=None):
+        """
+        The ids of the last ``history`` runs, before the given run.
+        """
+        sql = 'SELECT id FROM runs'
+        args = []
+        if before is not None:
+            sql += ' WHERE id < ?'
+            args.append(before)
+        sql += ' ORDER BY id DESC LIMIT ?'
+        args.append(self.history)
+        return [row[0] for row in self.db.execute(sql, args)]
+
+    def record(self, outputs):
+        """
+        Record the durations of a run. ``outputs`` is a list of (instance
+        name, output file) tuples. Returns the run id.
+        """
+        with self.db:
+            run = self.db.execute('INSERT INTO runs (time) VALUES (?)',
+                                  (time.time(),)).lastrowid
+            for host, output in outputs:
+                LOG.info(f'Recording test durations from {output}.')
+                self.db.executemany(
+                    'INSERT INTO results (run, host, kind, level, name, '
+                    'status, elapsed) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    ((run, host, *row) for row in read_output(output)))
+        return run
+
+    def _average(self, kind, group, runs, where=''):
+        if not runs:
+            return {}
+        marks = ','.join('?' * len(runs))
+        sql = (f'SELECT {group}, AVG(elapsed) FROM results '
+               f'WHERE kind = ? AND run IN ({marks}) {where} '
+               f'GROUP BY {group}')
+        return dict(self.db.execute(sql, [kind, *runs]))
+
+    def test_durations(self):
+        """
+        The average duration of each test in the recent runs.
+        """
+        return self._average('test', 'name', self.recent_runs())
+
+    def host_durations(self):
+        """
+        The average duration of the runs on each instance in the recent
+        runs.
+        """
+        return self._average('suite', 'host', self.recent_runs(),
+                             'AND level = 1')
+
+    def slowest(self, run, count=10):
+        """
+        The slowest tests of a run.
+        """
+        return self.db.execute(
+            'SELECT host, name, elapsed FROM results '
+            'WHERE run = ? AND kind = ? ORDER BY elapsed DESC LIMIT ?',
+            (run, 'test', count)).fetchall()
+
+    def regressions(self, run, factor=1.5, minimum=1.0):
+        """
+        The tests of a run which took longer than ``factor`` times their
+        average duration in the previous runs on the same instance, and at
+        least ``minimum`` seconds longer.
+
+        Returns a list of (host, name, elapsed, average) tuples.
+        """
+        runs = self.recent_runs(before=run)
+        if not runs:
+            return []
+        marks = ','.join('?' * len(runs))
+        sql = (
+            'SELECT r.host, r.name, r.elapsed, AVG(p.elapsed) AS average '
+            'FROM results r JOIN results p '
+            'ON p.host = r.host AND p.kind = r.kind AND p.name = r.name '
+            f'WHERE r.run = ? AND r.kind = ? AND p.run IN ({marks}) '
+            'GROUP BY r.host, r.name, r.elapsed '
+            'HAVING r.elapsed > average * ? AND r.elapsed - average >= ? '
+            'ORDER BY r.elapsed - average DESC')
+        return self.db.execute(
+            sql, [run, 'test', *runs, factor, minimum]).fetchall()
@@ -0,0 +1,254 @@
+#  Copyright (c) 2020-2024 Sine Nomine Associates
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""Test Instance Transports."""
+
+import os
+import shlex
+
+try:
+    from shlex import join as join_args
+    assert join_args  # hush pyflakes
+except ImportError:
+    from subprocess import list2cmdline as join_args
+
+from molecule import logger
+
+
+LOG = logger.get_logger(__name__)
+
+
+# The ssh master connection socket path, relative to the control path
+# directory. The tokens are expanded by ssh to the remote host name, port,
+# and user name.
+SSH_CONTROL_PATH = '%h-%p-%r'
+
+# The Ansible ssh control path setting of the same socket path. This is the
+# path set by the Molecule generated ansible.cfg.
+ANSIBLE_SSH_CONTROL_PATH = '%(directory)s/%%h-%%p-%%r'
+
+
+def ssh_control_path(directory):
+    """
+    The path of the ssh master connection sockets in a directory.
+
+    The verify playbooks are run with the same Ansible ssh control path, so
+    the verify playbooks and the robot run share one connection to each
+    host.
+    """
+    return os.path.join(directory, SSH_CONTROL_PATH)
+
+
+class Transport:
+    """
+    Run programs on a test instance with the client of the Ansible
+    connection of the instance.
+
+    The transport commands are run from the scenario directory on the
+    controller. The commands forward the stdin of the program when
+    ``interactive`` is set.
+    """
+
+    def __init__(self, name, host, **options):
+        self.name = name
+        self.host = host
+
+    def var(self, *names, default=None):
+        """
+        The first defined host variable of the given names.
+        """
+        for name in names:
+            if self.host.get(name) is not None:
+                return self.host[name]
+        return default
+
+    def command(self, argv, interactive=False):
+        raise NotImplementedError
+
+
+class Local(Transport):
+    """
+    Run programs directly on the controller.
+
+    Relative paths are relative to the scenario directory, the same as the
+    relative paths of the verify playbook tasks on a local connection.
+    """
+
+    def command(self, argv, interactive=False):
+        return list(argv)
+
+
+class Docker(Transport):
+    """
+    Run programs in a container with ``docker exec``.
+    """
+
+    executable = 'docker'
+    prefix = 'docker'
+
+    def client(self):
+        """
+        The container engine command and its global options.
+        """
+        p = self.prefix
+        cmd = [self.var(f'ansible_{p}_executable', default=self.executable)]
+        cmd.extend(shlex.split(self.var(f'ansible_{p}_extra_args',
+                                        default='')))
+        return cmd
+
+    @property
+    def container(self):
+        return self.var(f'ansible_{self.prefix}_host', 'ansible_host',
+                        default=self.name)
+
+    def command(self, argv, interactive=False):
+        cmd = self.client()
+        cmd.append('exec')
+        if interactive:
+            cmd.append('-i')
+        user = self.var(f'ansible_{self.prefix}_user', 'ansible_user')
+        if user:
+            cmd.extend(['-u', str(user)])
+        cmd.append(self.container)
+        cmd.extend(argv)
+        return cmd
+
+
+class Podman(Docker):
+    """
+    Run programs in a container with ``podman exec``.
+    """
+
+    executable = 'podman'
+    prefix = 'podman'
+
+
+class Kubectl(Transport):
+    """
+    Run programs in a pod with ``kubectl exec``.
+    """
+
+    executable = 'kubectl'
+    prefix = 'kubectl'
+
+    def command(self, argv, interactive=False):
+        p = self.prefix
+        cmd = [self.var(f'ansible_{p}_executable', default=self.executable)]
+        cmd.extend(shlex.split(self.var(f'ansible_{p}_extra_args',
+                                        default='')))
+        kubeconfig = self.var(f'ansible_{p}_kubeconfig')
+        if kubeconfig:
+            cmd.extend(['--kubeconfig', kubeconfig])
+        context = self.var(f'ansible_{p}_context')
+        if context:
+            cmd.extend(['--context', context])
+        namespace = self.var(f'ansible_{p}_namespace')
+        if namespace:
+            cmd.extend(['-n', namespace])
+        cmd.append('exec')
+        if interactive:
+            cmd.append('-i')
+        cmd.append(self.var(f'ansible_{p}_pod', 'ansible_host',
+                            default=self.name))
+        container = self.var(f'ansible_{p}_container')
+        if container:
+            cmd.extend(['-c', container])
+        cmd.append('--')
+        cmd.extend(argv)
+        return cmd
+
+
+class Oc(Kubectl):
+    """
+    Run programs in an OpenShift pod with ``oc exec``.
+    """
+
+    executable = 'oc'
+    prefix = 'oc'
+
+
+class Ssh(Transport):
+    """
+    Run programs over ssh.
+
+    The ssh master connection of the verify playbook is shared when a
+    ``control_path_dir`` is given.
+    """
+
+    def __init__(self, name, host, control_path_dir=None,
+                 control_persist='60s', **options):
+        super(Ssh, self).__init__(name, host, **options)
+        self.control_path_dir = control_path_dir
+        self.control_persist = control_persist
+
+    def command(self, argv, interactive=False):
+        ssh_host = self.var('ansible_host', default=self.name)
+        ssh_user = self.var('ansible_user')
+        ssh_port = self.var('ansible_port')
+        ssh_ident = self.var('ansible_private_key_file')
+        ssh_args = self.var('ansible_ssh_common_args', default='').split()
+        if ssh_port:
+            ssh_args.extend(['-p', str(ssh_port)])
+        if ssh_ident:
+            ssh_args.extend(['-i', ssh_ident])
+        if self.control_path_dir and \
+                not any('ControlPath' in a for a in ssh_args):
+            control_path = ssh_control_path(self.control_path_dir)
+            ssh_args.extend([
+                '-o', 'ControlMaster=auto',
+                '-o', f'ControlPath={control_path}',
+                '-o', f'ControlPersist={self.control_persist}',
+            ])
+        if ssh_user:
+            ssh_dest = '@'.join([ssh_user, ssh_host])
+        else:
+            ssh_dest = ssh_host
+        LOG.info('ssh command: %s' % ' '.join(['ssh', *ssh_args, ssh_dest]))
+        return ['ssh', *ssh_args, ssh_dest, join_args(argv)]
+
+
+# Transports by the short names of the Ansible connection plugins.
+TRANSPORTS = {
+    'local': Local,
+    'docker': Docker,
+    'docker_api': Docker,
+    'podman': Podman,
+    'kubectl': Kubectl,
+    'oc': Oc,
+    'ssh': Ssh,
+    'smart': Ssh,
+    'paramiko': Ssh,
+    'paramiko_ssh': Ssh,
+}
+
+
+def find(connection):
+    """
+    Find the transport of an Ansible connection plugin, given by its short
+    or fully qualified collection name. Returns None when the connection is
+    not supported.
+    """
+    transport = TRANSPORTS.get(connection.split('.')[-1])
+    if transport is None:
+        if 'docker' in connection:
+            transport = Docker
+        elif 'ssh' in connection:
+            transport = Ssh
+    return transport
@@ -0,0 +1,11 @@
+#
+# Fixtures for the verifier unit tests.
+#
+# The unit tests run parts of the verifier on the controller without creating
+# any instances. The verifier is created with a stand-in molecule
+# configuration.
+#
+
+from stubs import make_verifier
+
+__all__ = ['make_verifier']
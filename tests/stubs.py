@@ -0,0 +1,71 @@
+#
+# Stand-ins for the molecule configuration and playbooks, shared by the unit
+# tests and the benchmarks to create a verifier without any instances.
+#
+
+import types
+
+import pytest
+
+from molecule_robotframework.robotframework import Robotframework
+
+
+class StubPlaybook:
+    """Record the playbook arguments instead of running ansible."""
+
+    def __init__(self, playbook, config):
+        self.playbook = playbook
+        self.cli = {}
+        self.env = {}
+
+    def add_cli_arg(self, name, value):
+        self.cli[name] = value
+
+    def add_env_arg(self, name, value):
+        self.env[name] = value
+
+    def execute(self):
+        pass
+
+
+def make_config(directory, options, hosts):
+    config = types.SimpleNamespace()
+    config.config = {
+        'verifier': {
+            'name': 'molecule-robotframework',
+            'enabled': True,
+            'env': {},
+            'options': options,
+        },
+        'provisioner': {
+            'playbooks': {},
+            'ansible_args': [],
+        },
+    }
+    config.config_data = config.config
+    config.env = {}
+    config.debug = False
+    config.scenario = types.SimpleNamespace(
+        name='default',
+        directory=str(directory),
+        ephemeral_directory=str(directory),
+    )
+    config.provisioner = types.SimpleNamespace(
+        env={},
+        inventory={'all': {'hosts': hosts}},
+    )
+    return config
+
+
+@pytest.fixture
+def make_verifier(tmp_path):
+    """
+    Create a verifier with the given options and inventory hosts.
+    """
+    def make(options=None, hosts=None):
+        config = make_config(tmp_path, options or {}, hosts or {})
+        verifier = Robotframework(config)
+        verifier._playbooks = types.SimpleNamespace(
+            _get_playbook=lambda name: None)
+        return verifier
+    return make
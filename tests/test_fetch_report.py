@@ -0,0 +1,67 @@
+#
+# Check the failed downloads of the report files.
+#
+
+import pytest
+
+from molecule_robotframework import results
+
+HOSTS = {'instance01': {}, 'instance02': {}, 'instance03': {}}
+
+
+def failing_playbook(error):
+    calls = []
+
+    def execute_playbook(name, limit=None, extra_vars=None):
+        calls.append((name, limit))
+        raise error
+    execute_playbook.calls = calls
+    return execute_playbook
+
+
+def test_fetch_reports_failed(make_verifier):
+    verifier = make_verifier({}, HOSTS)
+    verifier.execute_playbook = failing_playbook(SystemExit(2))
+    fetched = verifier.fetch_reports(list(HOSTS.items()),
+                                     skipped=['instance03'])
+    assert fetched == {'instance01': 2, 'instance02': 2}
+    assert verifier.execute_playbook.calls == [
+        ('verify_fetch_report', 'instance01,instance02')]
+
+
+def test_fetch_reports_all_skipped(make_verifier):
+    verifier = make_verifier({}, HOSTS)
+    verifier.execute_playbook = failing_playbook(SystemExit(2))
+    assert verifier.fetch_reports(list(HOSTS.items()), skipped=list(HOSTS)) \
+        == {}
+
+
+def test_fetch_report_molecule_error(make_verifier):
+    exceptions = pytest.importorskip('molecule.exceptions')
+    if not hasattr(exceptions, 'MoleculeError'):
+        pytest.skip('molecule does not raise MoleculeError')
+    verifier = make_verifier({}, HOSTS)
+    verifier.execute_playbook = failing_playbook(
+        exceptions.MoleculeError('Ansible failed.', code=4))
+    assert verifier.fetch_report('instance01', {}, 3) == 4
+
+
+def test_fetch_report_exit_message(make_verifier):
+    verifier = make_verifier({}, HOSTS)
+    verifier.execute_playbook = failing_playbook(SystemExit('Failed.'))
+    assert verifier.fetch_report('instance01', {}, 3) == 1
+
+
+def test_results_fetch_failed():
+    r = results.Results()
+    r.add('instance01', 0)
+    r.add('instance02', 1)
+    r.skip('instance03')
+    r.fetch_failed('instance01', 2)
+    r.fetch_failed('instance02', 2)
+    r.fetch_failed('instance03', 2)
+    assert not r.passed
+    assert r.failed() == ['instance01', 'instance02']
+    assert r.hosts['instance02']['returncode'] == 1
+    assert r.skipped() == ['instance03']
+    assert r.exit_code == 2
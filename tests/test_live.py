@@ -0,0 +1,130 @@
+#
+# Check the live results and the fail fast stop of the robot runs.
+#
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+
+import pytest
+
+import molecule_robotframework
+from molecule_robotframework import live
+
+LISTENER = os.path.join(
+    os.path.dirname(molecule_robotframework.__file__),
+    'playbooks', 'files', 'robot_listener.py')
+
+
+def record(event, **data):
+    return live.RECORD + json.dumps(dict(data, event=event)) + '\n'
+
+
+def fake_proc():
+    return types.SimpleNamespace(stdin=io.StringIO())
+
+
+def test_record_counts():
+    results = live.LiveResults()
+    results.record('instance01', json.dumps({'event': 'start', 'total': 3}))
+    for status in ('PASS', 'FAIL', 'SKIP'):
+        results.record('instance01', json.dumps(
+            {'event': 'test', 'name': 'Tests.Test', 'status': status}))
+    results.record('instance01', 'not a record')
+    assert results.counts['instance01'] == \
+        {'total': 3, 'pass': 1, 'fail': 1, 'skip': 1}
+    assert results.summary('instance01') == \
+        '3/3 tests, 1 passed, 1 failed, 1 skipped'
+    assert not results.aborted.is_set()
+
+
+def test_shard_totals():
+    results = live.LiveResults()
+    results.record('instance01', json.dumps({'event': 'start', 'total': 2}))
+    results.record('instance01', json.dumps({'event': 'start', 'total': 3}))
+    assert results.counts['instance01']['total'] == 5
+
+
+def test_relay():
+    results = live.LiveResults()
+    stream = [
+        '==== Tests ====\n',
+        record('start', total=1),
+        # A record written in the middle of a console line.
+        'Tests.Test  ' + record('test', name='Tests.Test', status='PASS'),
+        '| PASS |\n',
+        'Output: output.xml',
+    ]
+    lines = []
+    results.relay('instance01', stream, lines.append)
+    assert lines == [
+        '==== Tests ====\n',
+        'Tests.Test  | PASS |\n',
+        'Output: output.xml',
+    ]
+    assert results.counts['instance01']['pass'] == 1
+
+
+def test_fail_fast_stop():
+    results = live.LiveResults(fail_fast=True)
+    procs = {name: fake_proc() for name in ('instance01', 'instance02')}
+    for name, proc in procs.items():
+        results.start(name, proc)
+    results.record('instance01', json.dumps(
+        {'event': 'test', 'name': 'Tests.Test', 'status': 'FAIL'}))
+    assert results.aborted.is_set()
+    for proc in procs.values():
+        assert proc.stdin.getvalue() == 'stop\n'
+
+    # Instances started after the abort are stopped at once.
+    late = fake_proc()
+    results.start('instance03', late)
+    assert late.stdin.getvalue() == 'stop\n'
+
+
+def test_no_fail_fast():
+    results = live.LiveResults()
+    proc = fake_proc()
+    results.start('instance01', proc)
+    results.record('instance01', json.dumps(
+        {'event': 'test', 'name': 'Tests.Test', 'status': 'FAIL'}))
+    assert not results.aborted.is_set()
+    assert proc.stdin.getvalue() == ''
+
+
+def test_robot_stopped(tmp_path):
+    pytest.importorskip('robot')
+    suite = tmp_path / 'tests.robot'
+    suite.write_text(
+        '*** Test Cases ***\n'
+        'Test 1\n    Should Not Be Equal    ${DELAY}    0s\n'
+        '    Sleep    ${DELAY}\n'
+        'Test 2\n    Sleep    ${DELAY}\n'
+        'Test 3\n    Sleep    ${DELAY}\n')
+    results = live.LiveResults(fail_fast=True)
+    procs = {}
+    for name, delay in (('fast', '0s'), ('slow', '10s')):
+        outputdir = tmp_path / name
+        procs[name] = subprocess.Popen(
+            [sys.executable, '-m', 'robot', '--listener', LISTENER,
+             '--variable', f'DELAY:{delay}', '--outputdir', str(outputdir),
+             '--report', 'NONE', '--log', 'NONE', str(suite)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True)
+        results.start(name, procs[name])
+    start = time.time()
+    # The first test fails at once on the fast instance, and takes the
+    # delay to pass on the slow instance.
+    results.relay('fast', procs['fast'].stdout, lambda line: None)
+    assert procs['fast'].wait() != 0
+    assert results.aborted.is_set()
+    results.relay('slow', procs['slow'].stdout, lambda line: None)
+    for name in procs:
+        results.finish(name)
+    assert procs['slow'].wait() != 0
+    assert time.time() - start < 10
+    assert results.counts['slow']['pass'] < 3
@@ -0,0 +1,99 @@
+#
+# Check the rerun of the failed tests of the previous verify.
+#
+
+import os
+import shutil
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import molecule_robotframework
+
+RUNNER = os.path.join(
+    os.path.dirname(molecule_robotframework.__file__),
+    'playbooks', 'files', 'robot_runner.py')
+
+SUITE = '''\
+*** Settings ***
+Library           OperatingSystem
+
+*** Test Cases ***
+Passing Test
+    Append To File    ${RUNS}    Passing Test\\n
+
+Flaky Test
+    Append To File    ${RUNS}    Flaky Test\\n
+    File Should Exist    ${MARKER}
+'''
+
+
+def read_tests(path):
+    tests = {}
+    for test in ET.parse(path).iter('test'):
+        status = test.find('status')
+        tests[test.get('name')] = (status.get('status'), status.text or '')
+    return tests
+
+
+def test_prepare_rerun(tmp_path, make_verifier):
+    hosts = {'instance01': {'ansible_connection': 'docker'}}
+    dest = tmp_path / 'output'
+    dest.mkdir()
+    (dest / 'output.xml').write_text('<robot/>')
+    verifier = make_verifier({'rerunfailed': True, 'dest_dir': str(dest)},
+                             hosts)
+    verifier.prepare_rerun()
+    rerun = verifier.rerun_output('instance01')
+    assert rerun == os.path.join(verifier.rerun_directory, 'instance01.xml')
+    assert open(rerun).read() == '<robot/>'
+
+    # The saved output files are removed when rerunfailed is not set.
+    verifier = make_verifier({'dest_dir': str(dest)}, hosts)
+    verifier.prepare_rerun()
+    assert not os.path.exists(verifier.rerun_directory)
+    assert verifier.rerun_output('instance01') is None
+
+
+def test_prepare_rerun_missing_output(tmp_path, make_verifier):
+    verifier = make_verifier(
+        {'rerunfailed': True, 'dest_dir': str(tmp_path / 'output')},
+        {'instance01': {}, 'instance02': {}})
+    verifier.prepare_rerun()
+    assert verifier.rerun_output('instance01') is None
+
+
+def test_runner_rerun(tmp_path):
+    pytest.importorskip('robot')
+    suite = tmp_path / 'tests.robot'
+    suite.write_text(SUITE)
+    runs = tmp_path / 'runs.txt'
+    marker = tmp_path / 'marker'
+    outputdir = tmp_path / 'output'
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, RUNNER, *args, '--',
+             '--variable', f'RUNS:{runs}', '--variable', f'MARKER:{marker}',
+             '--outputdir', str(outputdir), str(suite)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+    proc = run()
+    assert proc.returncode == 1, proc.stdout
+    previous = tmp_path / 'previous.xml'
+    shutil.copyfile(outputdir / 'output.xml', previous)
+    runs.write_text('')
+    marker.write_text('')
+
+    proc = run('--rerun', str(previous))
+    assert proc.returncode == 0, proc.stdout
+    assert runs.read_text() == 'Flaky Test\n'
+    tests = read_tests(outputdir / 'output.xml')
+    assert sorted(tests) == ['Flaky Test', 'Passing Test']
+    assert tests['Passing Test'][0] == 'PASS'
+    assert 're-executed' not in tests['Passing Test'][1]
+    assert tests['Flaky Test'][0] == 'PASS'
+    assert 're-executed' in tests['Flaky Test'][1]
+    assert (outputdir / 'report.html').exists()
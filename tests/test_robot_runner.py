@@ -0,0 +1,134 @@
+#
+# Check the shard runner uploaded to the test instances.
+#
+
+import importlib.util
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import molecule_robotframework
+
+pytest.importorskip('robot')
+
+RUNNER = os.path.join(
+    os.path.dirname(molecule_robotframework.__file__),
+    'playbooks', 'files', 'robot_runner.py')
+
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location('robot_runner', RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+runner = load_runner()
+
+
+def write_suites(directory, suites, tests, body='Log    ${TEST NAME}'):
+    directory.mkdir(exist_ok=True)
+    for s in range(1, suites + 1):
+        lines = ['*** Test Cases ***']
+        for t in range(1, tests + 1):
+            lines.extend([f'Test {s}.{t}', f'    {body}'])
+        (directory / f'suite{s}.robot').write_text('\n'.join(lines) + '\n')
+    return directory
+
+
+def run(tmp_path, *args):
+    return subprocess.run(
+        [sys.executable, RUNNER, *args], cwd=tmp_path,
+        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT, text=True)
+
+
+def output_tests(path):
+    return [t.get('name') for t in ET.parse(path).iter('test')]
+
+
+def test_split_by_suite():
+    tests = [('A', 'A.1'), ('A', 'A.2'), ('A', 'A.3'),
+             ('B', 'B.1'), ('C', 'C.1'), ('C', 'C.2')]
+    buckets = runner.split_tests(tests, 2)
+    assert sorted(buckets) == [['A.1', 'A.2', 'A.3'], ['C.1', 'C.2', 'B.1']]
+
+
+def test_split_by_test():
+    tests = [('A', f'A.{n}') for n in range(1, 5)]
+    buckets = runner.split_tests(tests, 2, shard_by='test')
+    assert sorted(len(b) for b in buckets) == [2, 2]
+    assert sorted(sum(buckets, [])) == [t for _, t in tests]
+
+
+def test_split_by_durations():
+    tests = [('A', 'A.1'), ('B', 'B.1'), ('C', 'C.1'), ('D', 'D.1')]
+    durations = {'A.1': 10.0, 'B.1': 1.0, 'C.1': 1.0}
+    buckets = runner.split_tests(tests, 2, durations=durations)
+    # The test without a known duration takes the median duration.
+    assert sorted(buckets) == [['A.1'], ['B.1', 'C.1', 'D.1']]
+
+
+def test_split_fewer_groups():
+    assert runner.split_tests([('A', 'A.1')], 3) == [['A.1']]
+
+
+def test_merge_order(tmp_path):
+    tests = write_suites(tmp_path / 'tests', 4, 3)
+    proc = run(tmp_path, '--shards', '3', '--shard-by', 'test', '--',
+               '--outputdir', 'output', str(tests))
+    assert proc.returncode == 0, proc.stdout
+    assert 'in 3 shards' in proc.stdout
+    assert output_tests(tmp_path / 'output' / 'output.xml') == [
+        f'Test {s}.{t}' for s in range(1, 5) for t in range(1, 4)]
+    assert not (tmp_path / 'output' / '.shards').exists()
+
+
+def test_failed_tests(tmp_path):
+    tests = write_suites(tmp_path / 'tests', 2, 2, body='Fail    Failed.')
+    proc = run(tmp_path, '--shards', '2', '--',
+               '--outputdir', 'output', str(tests))
+    assert proc.returncode == 4, proc.stdout
+
+
+def test_shard_crash(tmp_path):
+    tests = write_suites(tmp_path / 'tests', 2, 1)
+    (tests / 'suite2.robot').write_text(
+        '*** Test Cases ***\n'
+        'Test 2.1\n'
+        '    Evaluate    os.kill(os.getpid(), signal.SIGKILL)'
+        '    modules=os,signal\n')
+    proc = run(tmp_path, '--shards', '2', '--',
+               '--outputdir', 'output', str(tests))
+    assert proc.returncode >= 252, proc.stdout
+    assert 'Shard 2 failed' in proc.stdout
+    # The results of the other shard are kept.
+    assert output_tests(tmp_path / 'output' / 'output.xml') == ['Test 1.1']
+
+
+def test_invalid_option(tmp_path):
+    tests = write_suites(tmp_path / 'tests', 1, 1)
+    for shards in ('1', '2'):
+        proc = run(tmp_path, '--shards', shards, '--', '--bogus', str(tests))
+        assert proc.returncode == 252, proc.stdout
+        assert 'Traceback' not in proc.stdout
+
+
+def test_missing_source(tmp_path):
+    proc = run(tmp_path, '--shards', '2', '--', str(tmp_path / 'missing'))
+    assert proc.returncode == 252, proc.stdout
+    assert 'Traceback' not in proc.stdout
+
+
+def test_debugfile(tmp_path):
+    tests = write_suites(tmp_path / 'tests', 2, 1)
+    proc = run(tmp_path, '--shards', '2', '--',
+               '--outputdir', 'output', '--debugfile', 'debug.log',
+               str(tests))
+    assert proc.returncode == 0, proc.stdout
+    debug = (tmp_path / 'output' / 'debug.log').read_text()
+    assert '# shard 1' in debug and '# shard 2' in debug
+    assert 'Test 1.1' in debug and 'Test 2.1' in debug
@@ -1,5 +1,7 @@
 import os
+import json
 import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from contextlib import contextmanager
 
@@ -124,6 +126,72 @@ def molecule_test(scenario, platform=None):
             assert rc == 0, 'See "%s".' % logfile
 
 
+class Scenario:
+    """
+    Run molecule commands in a scenario and capture output.
+
+    The ephemeral directory of the scenario is kept in the log directory, so
+    the results saved by the verifier can be checked between the commands.
+    """
+
+    def __init__(self, name, env=None):
+        self.name = name
+        self.env = env or {}
+        self.logfile = LOGDIR / (name + '.log')
+        self.ephemeral_directory = LOGDIR / 'ephemeral' / name
+        self.testdir = Path(__file__).resolve().parent
+
+    def run(self, command):
+        """
+        Run a molecule command and return the exit code.
+        """
+        env = dict(os.environ, **ANSIBLE_VARS)
+        env.update(self.env)
+        env['MOLECULE_EPHEMERAL_DIRECTORY'] = str(self.ephemeral_directory)
+        with open(self.logfile, 'a') as f:
+            f.write(f'\n### molecule {command}\n')
+            f.flush()
+            proc = subprocess.Popen(
+                ['molecule', command, '--scenario-name', self.name],
+                cwd=self.testdir, env=env,
+                stdout=f.fileno(), stderr=subprocess.STDOUT)
+            return proc.wait()
+
+    def results(self):
+        """
+        The verifier results of the last verify.
+        """
+        with open(self.ephemeral_directory / 'results.json') as f:
+            return json.load(f)
+
+    def phases(self):
+        """
+        The names of the verifier phases of the last verify.
+        """
+        with open(self.ephemeral_directory / 'phases.json') as f:
+            return [record['phase'] for record in json.load(f)]
+
+
+@contextmanager
+def molecule_scenario(name, env=None):
+    """
+    Create and converge the instances of a scenario, then destroy them when
+    done. The molecule commands are run with the given extra environment
+    variables.
+    """
+    LOGDIR.mkdir(parents=True, exist_ok=True)
+    scenario = Scenario(name, env)
+    scenario.logfile.write_text('')
+    print('\nLogging to "%s".' % scenario.logfile)
+    try:
+        for command in ('dependency', 'destroy', 'create', 'converge'):
+            rc = scenario.run(command)
+            assert rc == 0, 'See "%s".' % scenario.logfile
+        yield scenario
+    finally:
+        scenario.run('destroy')
+
+
 def test_molecule_list():
     proc = subprocess.Popen(['molecule', 'list'])
     rc = proc.wait()
@@ -138,10 +206,35 @@ def test_git_test_source():
     molecule_test('git-test-source')
 
 
+def test_git_archive_test_source():
+    # The git test source is checked out and archived on the controller,
+    # and the archive is reused while the checkout is unchanged.
+    with molecule_scenario('git-archive-test-source') as scenario:
+        for _ in range(2):
+            rc = scenario.run('verify')
+            assert rc == 0, 'See "%s".' % scenario.logfile
+            host = scenario.results()['hosts']['instance01']
+            assert host['pass'] > 0 and host['fail'] == 0
+        git = scenario.ephemeral_directory / 'git'
+        assert [p.name for p in git.glob('*/.git')] == ['.git']
+        sync = scenario.ephemeral_directory / 'sync'
+        assert len(list(sync.glob('*.tar.gz'))) == 1
+        log = scenario.logfile.read_text()
+        assert 'Test source %s/ is unchanged.' % next(git.iterdir()) in log
+
+
 def test_multiple_testers():
     molecule_test('multiple-testers')
 
 
+def test_parallel():
+    molecule_test('parallel')
+
+
+def test_shards():
+    molecule_test('shards')
+
+
 def test_multiple_test_source():
     molecule_test('multiple-test-sources')
 
@@ -150,10 +243,165 @@ def test_outputdir():
     molecule_test('outputdir')
 
 
+def test_fetch_archive():
+    molecule_test('fetch-archive')
+
+
+def test_fetch_archive_outputdir():
+    # The debug file is not set, so only the reports are archived.
+    with molecule_scenario('fetch-archive-outputdir') as scenario:
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        output = scenario.testdir / 'molecule/fetch-archive-outputdir/output'
+        for name in ('instance01', 'instance02'):
+            files = sorted(os.listdir(output / name))
+            assert files == ['index.html', 'log.html', 'output.xml']
+
+
+def test_fetch_stream():
+    molecule_test('fetch-stream')
+
+
+def test_fetch_parallel():
+    molecule_test('fetch-parallel')
+
+
+def test_merge_reports():
+    molecule_test('merge-reports')
+
+
+def test_rerunfailed():
+    # The flaky test fails on the first verify and is the only test run by
+    # the second verify.
+    with molecule_scenario('rerunfailed') as scenario:
+        rc = scenario.run('verify')
+        assert rc != 0, 'See "%s".' % scenario.logfile
+        assert scenario.results()['hosts']['instance01']['fail'] == 1
+
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        host = scenario.results()['hosts']['instance01']
+        assert (host['pass'], host['fail']) == (1, 0)
+
+        output = scenario.testdir / 'molecule/rerunfailed/output/output.xml'
+        tests = {}
+        for test in ET.parse(output).iter('test'):
+            status = test.find('status')
+            tests[test.get('name')] = (status.get('status'), status.text or '')
+        assert sorted(tests) == ['Flaky Test', 'Passing Test']
+        assert tests['Passing Test'][0] == 'PASS'
+        assert 're-executed' not in tests['Passing Test'][1]
+        assert tests['Flaky Test'][0] == 'PASS'
+        assert 're-executed' in tests['Flaky Test'][1]
+
+
+def test_changed_only():
+    # Only the suite which imports the changed resource file is run again.
+    with molecule_scenario('changed-only') as scenario:
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        assert scenario.results()['hosts']['instance01']['pass'] == 2
+
+        # The verify is skipped when no suites have changed.
+        results = scenario.ephemeral_directory / 'results.json'
+        results.unlink()
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        assert not results.exists()
+
+        resource = scenario.testdir / \
+            'molecule/changed-only/files/tests/common.resource'
+        text = resource.read_text()
+        try:
+            resource.write_text(text + '    Log    Changed.\n')
+            rc = scenario.run('verify')
+        finally:
+            resource.write_text(text)
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        assert scenario.results()['hosts']['instance01']['pass'] == 1
+        output = scenario.testdir / 'molecule/changed-only/output/output.xml'
+        tests = [t.get('name') for t in ET.parse(output).iter('test')]
+        assert tests == ['Second Test']
+
+
+def test_timings():
+    molecule_test('timings')
+
+
+def test_venv_cache():
+    molecule_test('venv-cache')
+
+
+def test_fail_fast():
+    # The tests fail on instance01 and are stopped on the other instances.
+    with molecule_scenario('fail-fast') as scenario:
+        rc = scenario.run('verify')
+        assert rc != 0, 'See "%s".' % scenario.logfile
+        results = scenario.results()
+        assert not results['passed']
+        hosts = results['hosts']
+        assert hosts['instance01']['fail'] > 0
+        for name in ('instance02', 'instance03'):
+            host = hosts[name]
+            if host['returncode'] is None:
+                continue  # Skipped before robot was started.
+            assert host['returncode'] != 0
+            assert host['pass'] < 3
+            assert host['elapsed'] < 30
+
+
+def test_image_cache():
+    # The first verify prepares the instance and saves it as an image. An
+    # instance created from the saved image is not prepared again.
+    with molecule_scenario('image-cache') as scenario:
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        phases = scenario.phases()
+        assert 'playbook verify' in phases
+        assert 'image save' in phases
+
+    image = {'TESTER_IMAGE': 'molecule-robotframework-image-cache:latest'}
+    with molecule_scenario('image-cache', image) as scenario:
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        phases = scenario.phases()
+        assert 'image lookup' in phases
+        assert 'playbook verify' not in phases
+        assert 'image save' not in phases
+        assert scenario.results()['hosts']['instance01']['pass'] == 1
+
+
+def test_preflight():
+    # A broken suite fails the preflight check before the verify playbook
+    # prepares the instance.
+    broken = {'PREFLIGHT_SUITE': 'broken.robot'}
+    with molecule_scenario('preflight', broken) as scenario:
+        results = scenario.ephemeral_directory / 'results.json'
+        if results.exists():
+            results.unlink()
+        rc = scenario.run('verify')
+        assert rc != 0, 'See "%s".' % scenario.logfile
+        assert 'Preflight dryrun check failed' in scenario.logfile.read_text()
+        phases = scenario.phases()
+        assert 'preflight' in phases
+        assert not any(p.startswith('playbook') for p in phases)
+        assert not results.exists()
+
+    with molecule_scenario('preflight') as scenario:
+        rc = scenario.run('verify')
+        assert rc == 0, 'See "%s".' % scenario.logfile
+        phases = scenario.phases()
+        assert phases.index('preflight') < phases.index('playbook verify')
+
+
 def test_pre_test_source():
     molecule_test('pre-test-source')
 
 
+def test_sync_archive():
+    molecule_test('sync-archive')
+
+
 def test_resources():
     molecule_test('resources')
 
@@ -166,6 +414,10 @@ def test_local_libs():
     molecule_test('local-libs')
 
 
+def test_wheelhouse():
+    molecule_test('wheelhouse')
+
+
 @pytest.mark.parametrize('platform', sorted(PLATFORMS.keys()))
 def test_vagrant(platform):
     molecule_test('vagrant', platform)
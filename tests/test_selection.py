@@ -0,0 +1,114 @@
+#
+# Check the changed test suite selection.
+#
+
+import os
+
+from molecule_robotframework import selection
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(text)
+    return path
+
+
+def test_select_suites_library_names(tmp_path, make_verifier):
+    source = tmp_path / 'tests'
+    write(source / 'a.robot', '*** Test Cases ***\nA\n    No Operation\n')
+    library = write(tmp_path / 'MyLibrary-1.0.tar.gz', 'library')
+    verifier = make_verifier({
+        'changed_only': True,
+        'tests': [{'name': 'tests', 'source': f'{source}/'}],
+        'libraries': [
+            'robotframework-filelibrary',
+            {'name': 'OtherLibrary'},
+            {'file': str(library)},
+        ],
+    })
+    assert verifier.select_suites() == ['tests/a.robot']
+
+
+def test_parse_imports(tmp_path):
+    path = write(tmp_path / 'suite.robot', '''\
+*** Settings ***
+Documentation     Resource    not.resource
+Library           OperatingSystem
+Library           ${CURDIR}/MyLibrary.py    arg
+Resource          common.resource
+Variables         vars.yaml
+  Resource        continued.resource
+...               more.resource
+resource          lower.resource
+
+*** Test Cases ***
+Test
+    Import Resource    other.resource
+''')
+    assert selection.parse_imports(path) == [
+        ('library', 'OperatingSystem'),
+        ('library', '${CURDIR}/MyLibrary.py'),
+        ('resource', 'common.resource'),
+        ('variables', 'vars.yaml'),
+        ('resource', 'lower.resource'),
+    ]
+
+
+def test_parse_imports_pipes(tmp_path):
+    path = write(tmp_path / 'suite.robot', '''\
+| *** Settings ***   |
+| Library            | OperatingSystem
+| Resource           | common.resource |
+
+| *** Test Cases *** |
+| Test               | Log | Hello
+''')
+    assert selection.parse_imports(path) == [
+        ('library', 'OperatingSystem'),
+        ('resource', 'common.resource'),
+    ]
+
+
+def test_parse_imports_sections(tmp_path):
+    path = write(tmp_path / 'common.resource', '''\
+*** Setting ***
+Resource    first.resource
+
+*** Keywords ***
+Resource
+    No Operation
+
+*** Settings ***
+Resource    second.resource
+''')
+    assert selection.parse_imports(path) == [
+        ('resource', 'first.resource'),
+        ('resource', 'second.resource'),
+    ]
+
+
+def test_parse_imports_missing(tmp_path):
+    assert selection.parse_imports(tmp_path / 'missing.robot') == []
+
+
+def test_changed_suites(tmp_path, make_verifier):
+    source = tmp_path / 'tests'
+    write(source / 'first.robot', '*** Test Cases ***\nA\n    Log    A\n')
+    write(source / 'second.robot',
+          '*** Settings ***\nResource    common.resource\n'
+          '*** Test Cases ***\nB\n    Say Hello\n')
+    resource = write(source / 'common.resource',
+                     '*** Keywords ***\nSay Hello\n    Log    Hello\n')
+    verifier = make_verifier({
+        'changed_only': True,
+        'tests': [{'name': 'tests', 'source': f'{source}/'}],
+    })
+    verifier._selection = verifier.select_suites()
+    assert verifier._selection == ['tests/first.robot', 'tests/second.robot']
+    verifier.save_passed_suites()
+    assert verifier.select_suites() == []
+
+    with open(resource, 'a') as f:
+        f.write('    Log    Changed\n')
+    assert verifier.select_suites() == ['tests/second.robot']
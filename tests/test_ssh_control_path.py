@@ -0,0 +1,95 @@
+#
+# Check the robot run shares the ssh master connection of the verify
+# playbooks.
+#
+
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+from molecule.provisioner import ansible_playbook
+
+from stubs import StubPlaybook
+
+HOST = {
+    'ansible_connection': 'ssh',
+    'ansible_host': '127.0.0.1',
+    'ansible_port': 2222,
+    'ansible_user': 'tester',
+}
+
+# The ssh connection settings of the Molecule generated ansible.cfg, and the
+# Ansible defaults.
+ANSIBLE_CFG = {
+    'molecule': '[ssh_connection]\n'
+                'control_path = %(directory)s/%%h-%%p-%%r\n',
+    'default': '[ssh_connection]\n',
+}
+
+pytestmark = pytest.mark.skipif(
+    not shutil.which('ssh') or not shutil.which('ansible'),
+    reason='ssh and ansible are required')
+
+
+def expand_control_path(args):
+    """
+    The socket path ssh uses with the given options and destination.
+    """
+    output = subprocess.check_output(['ssh', '-G', *args], text=True)
+    for line in output.splitlines():
+        key, _, value = line.partition(' ')
+        if key == 'controlpath':
+            return value
+    return None
+
+
+def ansible_control_path(tmp_path, cfg, env):
+    """
+    The ssh ControlPath option Ansible passes to ssh for HOST.
+    """
+    config = tmp_path / 'ansible.cfg'
+    config.write_text('[defaults]\nhost_key_checking = False\n' + cfg)
+    env = dict(os.environ, ANSIBLE_CONFIG=str(config), ANSIBLE_TIMEOUT='1',
+               **env)
+    argv = ['ansible', 'all', '-i', HOST['ansible_host'] + ',',
+            '-m', 'ping', '-vvv',
+            '-e', 'ansible_port=%d' % HOST['ansible_port'],
+            '-e', 'ansible_user=%s' % HOST['ansible_user']]
+    proc = subprocess.run(argv, env=env, stdin=subprocess.DEVNULL,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True)
+    match = re.search(r'ControlPath="([^"]+)"', proc.stdout)
+    assert match, proc.stdout
+    return match.group(1)
+
+
+@pytest.mark.parametrize('cfg', ANSIBLE_CFG.keys())
+def test_shared_control_path(tmp_path, make_verifier, monkeypatch, cfg):
+    playbooks = []
+
+    def record(*args):
+        playbooks.append(StubPlaybook(*args))
+        return playbooks[-1]
+    monkeypatch.setattr(ansible_playbook, 'AnsiblePlaybook', record)
+    verifier = make_verifier({}, {'instance': HOST})
+    verifier.execute_playbook('verify')
+    env = {k: v for k, v in playbooks[0].env.items()
+           if k.startswith('ANSIBLE_SSH_')}
+    assert env
+
+    path = ansible_control_path(tmp_path, ANSIBLE_CFG[cfg], env)
+    playbook_socket = expand_control_path([
+        '-o', f'ControlPath={path}',
+        '-o', 'Port=%d' % HOST['ansible_port'],
+        '-o', 'User=%s' % HOST['ansible_user'],
+        HOST['ansible_host'],
+    ])
+
+    cmd = verifier.remote_command('instance', HOST, ['robot'])
+    assert cmd[0] == 'ssh'
+    robot_socket = expand_control_path(cmd[1:-1])
+
+    assert playbook_socket == robot_socket
+    assert playbook_socket.startswith(verifier.ssh_control_path_dir)
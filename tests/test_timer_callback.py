@@ -0,0 +1,65 @@
+#
+# Check the task timer callback of the verifier playbooks.
+#
+
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import molecule_robotframework
+
+CALLBACK_PLUGINS = os.path.join(
+    os.path.dirname(molecule_robotframework.__file__),
+    'playbooks', 'callback_plugins')
+
+# The duration of the sleep task on each host.
+DELAYS = {'fast': 0, 'slow': 2}
+
+PLAYBOOK = '''\
+- name: Timer
+  hosts: all
+  strategy: "{{ strategy }}"
+  gather_facts: no
+  tasks:
+    - name: Sleep
+      command: sleep {{ delay }}
+
+    - name: Echo
+      command: echo done
+'''
+
+pytestmark = pytest.mark.skipif(
+    not shutil.which('ansible-playbook'),
+    reason='ansible-playbook is required')
+
+
+@pytest.mark.parametrize('strategy', ['free', 'host_pinned', 'linear'])
+def test_task_times(tmp_path, strategy):
+    inventory = tmp_path / 'inventory.yml'
+    inventory.write_text(json.dumps({'all': {'hosts': {
+        name: {'ansible_connection': 'local', 'delay': delay}
+        for name, delay in DELAYS.items()}}}))
+    playbook = tmp_path / 'timer.yml'
+    playbook.write_text(PLAYBOOK)
+    task_times = tmp_path / 'tasks.json'
+    env = dict(os.environ,
+               ANSIBLE_CALLBACK_PLUGINS=CALLBACK_PLUGINS,
+               MOLECULE_ROBOTFRAMEWORK_TASK_TIMES=str(task_times))
+    subprocess.run(['ansible-playbook', '-i', str(inventory),
+                    '-e', f'strategy={strategy}', str(playbook)],
+                   env=env, stdin=subprocess.DEVNULL, check=True,
+                   stdout=subprocess.DEVNULL)
+
+    tasks = json.loads(task_times.read_text())
+    assert [t['task'] for t in tasks] == ['Sleep', 'Echo']
+    sleep, echo = tasks
+    for task in tasks:
+        assert sorted(task['hosts']) == sorted(DELAYS)
+    assert sleep['hosts']['slow'] >= DELAYS['slow']
+    assert sleep['hosts']['fast'] < DELAYS['slow']
+    assert sleep['elapsed'] >= DELAYS['slow']
+    assert echo['hosts']['fast'] < DELAYS['slow']
+    assert echo['hosts']['slow'] < DELAYS['slow']
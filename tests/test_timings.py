@@ -0,0 +1,19 @@
+#
+# Check the timings options.
+#
+
+import pytest
+
+
+@pytest.mark.parametrize('value, expected', [(None, 5), (3, 3), ('10', 10)])
+def test_timings_history(make_verifier, value, expected):
+    options = {} if value is None else {'timings_history': value}
+    assert make_verifier(options).timings_history == expected
+
+
+@pytest.mark.parametrize('value', [0, -1, 'ten', '2.5', None, []])
+def test_timings_history_invalid(make_verifier, value):
+    verifier = make_verifier({'timings_history': value})
+    with pytest.raises(SystemExit) as e:
+        verifier.timings_history
+    assert e.value.code == 1